@@ -7,13 +7,28 @@ Includes calculations for design, finance, and mathematics.
 """
 
 import math
-from typing import List, Tuple, Dict, Optional
+import operator
+import sys
+from typing import List, Tuple, Dict, Optional, Union
 
-# Constants
-PHI = (1 + math.sqrt(5)) / 2  # 1.6180339887498948482...
-PSI = (1 - math.sqrt(5)) / 2  # -0.6180339887498948482...
-GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))  # ~137.5° in radians
-GOLDEN_ANGLE_DEGREES = 360 / (PHI ** 2)  # ~137.5077°
+import numpy as np
+
+# Constants (double-precision literals, so nothing is computed at import)
+PHI = 1.618033988749895  # (1 + √5) / 2 = 1.6180339887498948482...
+PSI = -0.6180339887498949  # (1 - √5) / 2 = -0.6180339887498948482...
+GOLDEN_ANGLE = 2.399963229728653  # π(3 - √5), ~137.5° in radians
+GOLDEN_ANGLE_DEGREES = 137.50776405003785  # 360 / φ², ~137.5077°
+
+# Precomputed φ^i and φ^-i for the design scales (extended on demand)
+_PHI_POW = [PHI ** i for i in range(32)]
+_INV_PHI_POW = [1.0 / p for p in _PHI_POW]
+
+
+def _ensure_phi_powers(n: int) -> None:
+    """Extend the φ power tables so that index n is available."""
+    while len(_PHI_POW) <= n:
+        _PHI_POW.append(PHI ** len(_PHI_POW))
+        _INV_PHI_POW.append(1.0 / _PHI_POW[-1])
 
 
 class GoldenRatio:
@@ -66,8 +81,8 @@ class GoldenRectangle:
         height = width / PHI
         return {
             'width': width,
-            'height': round(height, 4),
-            'area': round(width * height, 4),
+            'height': height,
+            'area': width * height,
             'ratio': PHI
         }
 
@@ -76,79 +91,99 @@ class GoldenRectangle:
         """Calculate golden rectangle dimensions from height."""
         width = height * PHI
         return {
-            'width': round(width, 4),
+            'width': width,
             'height': height,
-            'area': round(width * height, 4),
+            'area': width * height,
             'ratio': PHI
         }
 
     @staticmethod
-    def subdivide(width: float, height: float, n: int = 5) -> List[Dict[str, float]]:
+    def subdivide_soa(width: float, height: float, n: int = 5) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Recursively subdivide a golden rectangle.
+        Subdivide a golden rectangle into squares, as parallel arrays.
 
-        Returns list of squares and remaining rectangles.
+        For a golden rectangle every cut leaves another golden rectangle,
+        so the square sides are simply min(width, height) * φ^-i and are
+        computed directly instead of by repeated subtraction.
+
+        Returns:
+            (sides, iterations): float64 and int64 arrays of length n
+            (empty when n <= 0)
         """
-        subdivisions = []
+        n = max(n, 0)
+        iterations = np.arange(n)
+        short = min(width, height)
+        if short > 0 and abs(max(width, height) / short - PHI) < 1e-9:
+            _ensure_phi_powers(n)
+            return short * np.array(_INV_PHI_POW[:n]), iterations
+
+        sides = np.empty(n)
         w, h = width, height
-
         for i in range(n):
             if w > h:
                 # Remove square from left
-                subdivisions.append({
-                    'type': 'square',
-                    'side': h,
-                    'iteration': i
-                })
+                sides[i] = h
                 w = w - h
             else:
                 # Remove square from bottom
-                subdivisions.append({
-                    'type': 'square',
-                    'side': w,
-                    'iteration': i
-                })
+                sides[i] = w
                 h = h - w
 
-        return subdivisions
+        return sides, iterations
+
+    @staticmethod
+    def subdivide(width: float, height: float, n: int = 5) -> List[Dict[str, float]]:
+        """
+        Recursively subdivide a golden rectangle.
+
+        Returns list of squares and remaining rectangles.
+        """
+        sides, _ = GoldenRectangle.subdivide_soa(width, height, n)
+        return [
+            {'type': 'square', 'side': side, 'iteration': i}
+            for i, side in enumerate(sides.tolist())
+        ]
 
 
 class Fibonacci:
     """Fibonacci sequence calculations."""
 
-    @staticmethod
-    def sequence(n: int) -> List[int]:
-        """Generate first n Fibonacci numbers."""
-        if n <= 0:
-            return []
-        if n == 1:
-            return [1]
+    # Longest prefix of the sequence computed so far, shared by sequence()
+    # and nth() and extended on demand
+    _cache = [1, 1]
 
-        fib = [1, 1]
-        for i in range(2, n):
+    @classmethod
+    def _extend(cls, n: int) -> List[int]:
+        """Grow the cached prefix to at least n numbers and return it."""
+        fib = cls._cache
+        while len(fib) < n:
             fib.append(fib[-1] + fib[-2])
         return fib
 
-    @staticmethod
-    def nth(n: int) -> int:
+    @classmethod
+    def sequence(cls, n: int) -> List[int]:
+        """Generate first n Fibonacci numbers."""
+        if n <= 0:
+            return []
+        return cls._extend(n)[:n]
+
+    @classmethod
+    def nth(cls, n: int) -> int:
         """Calculate nth Fibonacci number using iteration."""
         if n <= 0:
             return 0
-        if n <= 2:
-            return 1
-
-        a, b = 1, 1
-        for _ in range(2, n):
-            a, b = b, a + b
-        return b
+        return cls._extend(n)[n - 1]
 
     @staticmethod
     def nth_binet(n: int) -> int:
         """
         Calculate nth Fibonacci number using Binet's formula.
 
-        Note: Loses precision for n > ~70 due to floating-point.
+        Note: Float64 loses precision for n > 70, so larger n fall back
+        to the exact iterative result.
         """
+        if n > 70:
+            return Fibonacci.nth(n)
         return round((PHI**n - PSI**n) / math.sqrt(5))
 
     @staticmethod
@@ -183,13 +218,14 @@ class DesignScale:
         Returns:
             Dictionary of size names to values
         """
+        _ensure_phi_powers(max(n_larger, n_smaller))
         sizes = {'base': base}
 
         for i in range(1, n_larger + 1):
-            sizes[f'lg{i}'] = round(base * (PHI ** i), 2)
+            sizes[f'lg{i}'] = base * _PHI_POW[i]
 
         for i in range(1, n_smaller + 1):
-            sizes[f'sm{i}'] = round(base / (PHI ** i), 2)
+            sizes[f'sm{i}'] = base * _INV_PHI_POW[i]
 
         return sizes
 
@@ -205,14 +241,14 @@ class DesignScale:
         Returns:
             Dictionary of element names to font sizes
         """
+        _ensure_phi_powers(levels)
         scale = {'body': base}
 
         for i in range(1, levels + 1):
-            size = base * (PHI ** i)
-            scale[f'h{levels - i + 1}'] = round(size, 2)
+            scale[f'h{levels - i + 1}'] = base * _PHI_POW[i]
 
-        scale['small'] = round(base / PHI, 2)
-        scale['tiny'] = round(base / (PHI ** 2), 2)
+        scale['small'] = base * _INV_PHI_POW[1]
+        scale['tiny'] = base * _INV_PHI_POW[2]
 
         return scale
 
@@ -228,10 +264,10 @@ class DesignScale:
 
         return {
             'total': total_width,
-            'main': round(main, 2),
-            'sidebar': round(sidebar, 2),
-            'main_percent': round(100 * PHI / (1 + PHI), 2),
-            'sidebar_percent': round(100 / (1 + PHI), 2)
+            'main': main,
+            'sidebar': sidebar,
+            'main_percent': 100 * PHI / (1 + PHI),
+            'sidebar_percent': 100 / (1 + PHI)
         }
 
 
@@ -241,6 +277,10 @@ class FibonacciTrading:
     RETRACEMENT_LEVELS = [0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0]
     EXTENSION_LEVELS = [1.272, 1.618, 2.0, 2.618, 4.236]
 
+    # Level arrays shared by the batch methods
+    _RETRACEMENT_ARRAY = np.array(RETRACEMENT_LEVELS, dtype=np.float64)
+    _EXTENSION_ARRAY = np.array(EXTENSION_LEVELS, dtype=np.float64)
+
     @staticmethod
     def retracements(high: float, low: float, is_uptrend: bool = True) -> Dict[str, float]:
         """
@@ -262,7 +302,7 @@ class FibonacciTrading:
                 price = high - (diff * level)
             else:
                 price = low + (diff * level)
-            levels[f"{level*100:.1f}%"] = round(price, 4)
+            levels[f"{level*100:.1f}%"] = price
 
         return levels
 
@@ -277,10 +317,60 @@ class FibonacciTrading:
                 price = low + (diff * level)
             else:
                 price = high - (diff * level)
-            levels[f"{level*100:.1f}%"] = round(price, 4)
+            levels[f"{level*100:.1f}%"] = price
 
         return levels
 
+    @staticmethod
+    def _batch_inputs(
+        highs: np.ndarray, lows: np.ndarray, is_uptrend: Union[bool, np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Shape highs, lows and the trend flag(s) as (N, 1) columns."""
+        highs = np.asarray(highs, dtype=np.float64).reshape(-1, 1)
+        lows = np.asarray(lows, dtype=np.float64).reshape(-1, 1)
+        trend = np.asarray(is_uptrend, dtype=bool)
+        if trend.ndim:
+            trend = trend.reshape(-1, 1)
+        return highs, lows, trend
+
+    @staticmethod
+    def retracements_batch(
+        highs: np.ndarray, lows: np.ndarray, is_uptrend: Union[bool, np.ndarray] = True
+    ) -> np.ndarray:
+        """
+        Calculate retracement levels for many swings at once.
+
+        Args:
+            highs: Swing high prices, shape (N,)
+            lows: Swing low prices, shape (N,)
+            is_uptrend: A single trend flag or one flag per swing
+
+        Returns:
+            Array of shape (N, 7); column j is RETRACEMENT_LEVELS[j]
+        """
+        highs, lows, trend = FibonacciTrading._batch_inputs(highs, lows, is_uptrend)
+        offsets = (highs - lows) * FibonacciTrading._RETRACEMENT_ARRAY
+        return np.where(trend, highs - offsets, lows + offsets)
+
+    @staticmethod
+    def extensions_batch(
+        highs: np.ndarray, lows: np.ndarray, is_uptrend: Union[bool, np.ndarray] = True
+    ) -> np.ndarray:
+        """
+        Calculate extension levels for many swings at once.
+
+        Args:
+            highs: Swing high prices, shape (N,)
+            lows: Swing low prices, shape (N,)
+            is_uptrend: A single trend flag or one flag per swing
+
+        Returns:
+            Array of shape (N, 5); column j is EXTENSION_LEVELS[j]
+        """
+        highs, lows, trend = FibonacciTrading._batch_inputs(highs, lows, is_uptrend)
+        offsets = (highs - lows) * FibonacciTrading._EXTENSION_ARRAY
+        return np.where(trend, lows + offsets, highs - offsets)
+
     @staticmethod
     def golden_pocket(high: float, low: float, is_uptrend: bool = True) -> Dict[str, float]:
         """Calculate the golden pocket zone (61.8% - 65%)."""
@@ -294,15 +384,32 @@ class FibonacciTrading:
             upper = low + (diff * 0.65)
 
         return {
-            'upper': round(upper, 4),
-            'lower': round(lower, 4),
-            'midpoint': round((upper + lower) / 2, 4)
+            'upper': upper,
+            'lower': lower,
+            'midpoint': (upper + lower) / 2
         }
 
 
 class Phyllotaxis:
     """Phyllotaxis pattern generation."""
 
+    @staticmethod
+    def sunflower_pattern_soa(n_points: int, c: float = 2.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate sunflower seed pattern points as coordinate arrays.
+
+        Args:
+            n_points: Number of points to generate
+            c: Scaling constant
+
+        Returns:
+            (xs, ys): float64 arrays of length n_points, ready for plotting
+        """
+        i = np.arange(n_points)
+        r = c * np.sqrt(i)
+        theta = i * GOLDEN_ANGLE
+        return r * np.cos(theta), r * np.sin(theta)
+
     @staticmethod
     def sunflower_pattern(n_points: int, c: float = 2.0) -> List[Tuple[float, float]]:
         """
@@ -315,14 +422,8 @@ class Phyllotaxis:
         Returns:
             List of (x, y) coordinates
         """
-        points = []
-        for i in range(n_points):
-            r = c * math.sqrt(i)
-            theta = i * GOLDEN_ANGLE
-            x = r * math.cos(theta)
-            y = r * math.sin(theta)
-            points.append((round(x, 4), round(y, 4)))
-        return points
+        xs, ys = Phyllotaxis.sunflower_pattern_soa(n_points, c)
+        return list(zip(xs.tolist(), ys.tolist()))
 
     @staticmethod
     def golden_spiral_points(n_points: int = 100, growth: float = PHI) -> List[Tuple[float, float]]:
@@ -336,20 +437,19 @@ class Phyllotaxis:
         Returns:
             List of (x, y) coordinates
         """
-        points = []
-        for i in range(n_points):
-            angle = i * 0.1
-            r = growth ** (angle / (2 * math.pi))
-            x = r * math.cos(angle)
-            y = r * math.sin(angle)
-            points.append((round(x, 4), round(y, 4)))
-        return points
+        angle = np.arange(n_points) * 0.1
+        r = np.power(growth, angle / (2 * math.pi))
+        x = r * np.cos(angle)
+        y = r * np.sin(angle)
+        return list(zip(x.tolist(), y.tolist()))
 
 
 class GoldenHash:
     """Golden ratio based hashing utilities."""
 
-    INV_PHI = (math.sqrt(5) - 1) / 2  # ~0.618
+    INV_PHI = 0.6180339887498949  # (√5 - 1) / 2, ~0.618
+    FIB_MULT = 11400714819323198485  # 2^64 / φ, Knuth's multiplier
+    MASK64 = (1 << 64) - 1
 
     @staticmethod
     def hash(key: int, table_size: int) -> int:
@@ -357,82 +457,84 @@ class GoldenHash:
         Hash using golden ratio multiplication method.
 
         Provides excellent distribution for sequential keys.
+
+        Works in 64-bit fixed point: the low 64 bits of key * 2^64/φ are
+        the fractional part of key/φ, and multiplying by table_size then
+        shifting right by 64 scales it to [0, table_size) without any
+        floating-point rounding.
         """
-        fractional = (key * GoldenHash.INV_PHI) % 1
-        return int(table_size * fractional)
+        fractional = (key * GoldenHash.FIB_MULT) & GoldenHash.MASK64
+        return (fractional * table_size) >> 64
 
     @staticmethod
-    def weyl_sequence(n: int, seed: float = 0.5) -> List[float]:
+    def weyl_sequence(n: int, seed: float = 0.5, *, state: Optional[int] = None) -> List[float]:
         """
         Generate quasi-random numbers using golden ratio.
 
         Returns well-distributed sequence in [0, 1).
+
+        The state is a 64-bit fixed-point fraction advanced by 2^64/φ, so
+        the wraparound at 1 is an integer mask instead of a float modulo
+        and the sequence is bit-for-bit reproducible. The seed is a
+        fraction (taken mod 1) of any real type; pass state to start from
+        a raw 64-bit integer state instead, e.g. to resume a sequence.
         """
+        if state is None:
+            state = int(float(seed) * (1 << 64)) & GoldenHash.MASK64
+        else:
+            state = operator.index(state) & GoldenHash.MASK64
+
         sequence = []
-        state = seed
         for _ in range(n):
-            state = (state + GoldenHash.INV_PHI) % 1
-            sequence.append(round(state, 6))
+            state = (state + GoldenHash.FIB_MULT) & GoldenHash.MASK64
+            # Top 53 bits give an exact double, which is always < 1
+            sequence.append((state >> 11) / (1 << 53))
         return sequence
 
 
 def demo():
     """Demonstrate calculator functionality."""
-    print("=" * 60)
-    print("GOLDEN RATIO CALCULATOR DEMO")
-    print("=" * 60)
+    # Collect the whole report and write it once instead of per line
+    lines = []
+
+    def section(title: str) -> None:
+        lines.extend(["", "-" * 40, title, "-" * 40])
 
-    print(f"\n📐 φ = {PHI}")
-    print(f"📐 1/φ = {1/PHI}")
-    print(f"📐 φ² = {PHI**2}")
+    lines.extend(["=" * 60, "GOLDEN RATIO CALCULATOR DEMO", "=" * 60])
 
-    print("\n" + "-" * 40)
-    print("GOLDEN RECTANGLE (width=1920)")
-    print("-" * 40)
+    lines.append(f"\n📐 φ = {PHI}")
+    lines.append(f"📐 1/φ = {1/PHI}")
+    lines.append(f"📐 φ² = {PHI**2}")
+
+    section("GOLDEN RECTANGLE (width=1920)")
     rect = GoldenRectangle.from_width(1920)
-    for k, v in rect.items():
-        print(f"  {k}: {v}")
+    lines.extend(f"  {k}: {v:.4f}" for k, v in rect.items())
 
-    print("\n" + "-" * 40)
-    print("FIBONACCI SEQUENCE (first 15)")
-    print("-" * 40)
+    section("FIBONACCI SEQUENCE (first 15)")
     fib = Fibonacci.sequence(15)
-    print(f"  {fib}")
+    lines.append(f"  {fib}")
 
-    print("\n" + "-" * 40)
-    print("DESIGN SPACING SCALE (base=16)")
-    print("-" * 40)
+    section("DESIGN SPACING SCALE (base=16)")
     scale = DesignScale.spacing_scale(16)
-    for k, v in sorted(scale.items()):
-        print(f"  {k}: {v}px")
+    lines.extend(f"  {k}: {v:.2f}px" for k, v in sorted(scale.items()))
 
-    print("\n" + "-" * 40)
-    print("TYPOGRAPHY SCALE (base=16)")
-    print("-" * 40)
+    section("TYPOGRAPHY SCALE (base=16)")
     type_scale = DesignScale.type_scale(16)
-    for k, v in type_scale.items():
-        print(f"  {k}: {v}px")
+    lines.extend(f"  {k}: {v:.2f}px" for k, v in type_scale.items())
 
-    print("\n" + "-" * 40)
-    print("FIBONACCI RETRACEMENTS (high=200, low=100)")
-    print("-" * 40)
+    section("FIBONACCI RETRACEMENTS (high=200, low=100)")
     retracements = FibonacciTrading.retracements(200, 100)
-    for level, price in retracements.items():
-        print(f"  {level}: ${price}")
+    lines.extend(f"  {level}: ${price:.4f}" for level, price in retracements.items())
 
-    print("\n" + "-" * 40)
-    print("GOLDEN POCKET")
-    print("-" * 40)
+    section("GOLDEN POCKET")
     pocket = FibonacciTrading.golden_pocket(200, 100)
-    for k, v in pocket.items():
-        print(f"  {k}: ${v}")
+    lines.extend(f"  {k}: ${v:.4f}" for k, v in pocket.items())
 
-    print("\n" + "-" * 40)
-    print("LAYOUT DIVISIONS (width=1200)")
-    print("-" * 40)
+    section("LAYOUT DIVISIONS (width=1200)")
     layout = DesignScale.layout_divisions(1200)
-    for k, v in layout.items():
-        print(f"  {k}: {v}")
+    lines.extend(f"  {k}: {v:.2f}" for k, v in layout.items())
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
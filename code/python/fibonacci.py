@@ -10,23 +10,81 @@ import math
 import time
 from functools import lru_cache
 from typing import List, Tuple, Generator
+
 import numpy as np
 
-# Constants
-PHI = (1 + math.sqrt(5)) / 2
-PSI = (1 - math.sqrt(5)) / 2
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; the kernels then run as plain Python
+    HAVE_NUMBA = False
+    prange = range
 
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function untouched."""
+        return lambda func: func
 
-def fib_recursive(n: int) -> int:
+try:
+    import gmpy2
+except ImportError:  # gmpy2 is optional; pure-Python paths are used instead
+    gmpy2 = None
+
+if gmpy2 is not None:
+    _library_is_prime = gmpy2.is_prime
+else:
+    try:
+        from sympy import isprime as _library_is_prime
+    except ImportError:  # Neither installed; is_prime uses trial division
+        _library_is_prime = None
+
+# Constants (double-precision literals, so nothing is computed at import)
+PHI = 1.618033988749895  # (1 + √5) / 2
+PSI = -0.6180339887498949  # (1 - √5) / 2
+
+# Largest n for which the exponential naive recursion is still run
+NAIVE_RECURSION_LIMIT = 30
+
+# Largest inputs whose results fit in a signed 64-bit integer. The JIT
+# kernels work on int64, so anything beyond these falls back to Python ints.
+INT64_MAX = 2**63 - 1
+FIB_INT64_LIMIT = 92
+LUCAS_INT64_LIMIT = 90
+TRIBONACCI_INT64_LIMIT = 74
+
+# Below this, trial division beats calling into a primality library
+TRIAL_DIVISION_LIMIT = 10**6
+
+# Largest n for which Binet's formula in float64 still rounds to F(n)
+BINET_EXACT_LIMIT = 70
+
+
+def fib_recursive_naive(n: int) -> int:
     """
     Naive recursive Fibonacci.
 
     Time: O(φⁿ) - exponential
     Space: O(n) - call stack
+
+    Kept as a reference implementation; only practical for small n.
     """
     if n <= 1:
         return n
-    return fib_recursive(n - 1) + fib_recursive(n - 2)
+    return fib_recursive_naive(n - 1) + fib_recursive_naive(n - 2)
+
+
+def fib_recursive(n: int) -> int:
+    """
+    Recursive Fibonacci.
+
+    Uses the naive recursion up to NAIVE_RECURSION_LIMIT and the
+    memoized recursion above it, so large n no longer takes O(φⁿ).
+
+    Time: O(φⁿ) for n <= 30, O(n) otherwise
+    Space: O(n)
+    """
+    if n <= NAIVE_RECURSION_LIMIT:
+        return fib_recursive_naive(n)
+    return fib_memoized(n)
 
 
 @lru_cache(maxsize=None)
@@ -42,13 +100,7 @@ def fib_memoized(n: int) -> int:
     return fib_memoized(n - 1) + fib_memoized(n - 2)
 
 
-def fib_iterative(n: int) -> int:
-    """
-    Iterative Fibonacci.
-
-    Time: O(n)
-    Space: O(1)
-    """
+def _fib_iterative_loop(n: int) -> int:
     if n <= 1:
         return n
 
@@ -58,6 +110,23 @@ def fib_iterative(n: int) -> int:
     return b
 
 
+_fib_iterative_njit = njit(cache=True)(_fib_iterative_loop)
+
+
+def fib_iterative(n: int) -> int:
+    """
+    Iterative Fibonacci.
+
+    Time: O(n)
+    Space: O(1)
+
+    Runs as native code when Numba is installed and F(n) fits in int64.
+    """
+    if n <= FIB_INT64_LIMIT:
+        return _fib_iterative_njit(n)
+    return _fib_iterative_loop(n)
+
+
 def fib_generator(n: int) -> Generator[int, None, None]:
     """
     Generator for Fibonacci sequence.
@@ -78,8 +147,12 @@ def fib_binet(n: int) -> int:
     Time: O(1) - but O(log n) for exponentiation
     Space: O(1)
 
-    Warning: Loses precision for n > ~70
+    Float64 only has 53 bits of mantissa, so the formula stops rounding
+    to the right integer past n = 70 (and PHI**n overflows past ~1474).
+    Beyond that the exact fast-doubling result is returned instead.
     """
+    if n > BINET_EXACT_LIMIT:
+        return fib_fast_doubling(n)
     return round((PHI**n - PSI**n) / math.sqrt(5))
 
 
@@ -92,29 +165,23 @@ def fib_matrix(n: int) -> int:
 
     Uses the identity:
     [[1, 1], [1, 0]]^n = [[F(n+1), F(n)], [F(n), F(n-1)]]
+
+    Squaring that matrix reduces to the doubling identities below, so
+    only (F(k), F(k+1)) is tracked while walking the bits of n from the
+    most significant end: 3 big-integer multiplies per bit instead of 8.
     """
     if n <= 1:
         return n
 
-    def matrix_mult(A: np.ndarray, B: np.ndarray) -> np.ndarray:
-        return np.array([
-            [A[0, 0] * B[0, 0] + A[0, 1] * B[1, 0],
-             A[0, 0] * B[0, 1] + A[0, 1] * B[1, 1]],
-            [A[1, 0] * B[0, 0] + A[1, 1] * B[1, 0],
-             A[1, 0] * B[0, 1] + A[1, 1] * B[1, 1]]
-        ], dtype=object)
-
-    def matrix_pow(M: np.ndarray, p: int) -> np.ndarray:
-        if p == 1:
-            return M
-        if p % 2 == 0:
-            half = matrix_pow(M, p // 2)
-            return matrix_mult(half, half)
-        return matrix_mult(M, matrix_pow(M, p - 1))
-
-    F = np.array([[1, 1], [1, 0]], dtype=object)
-    result = matrix_pow(F, n)
-    return result[0, 1]
+    a, b = 0, 1  # (F(k), F(k+1)) with k = 0
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b  # F(2k+1)
+        if bit == '1':
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
 
 
 def fib_fast_doubling(n: int) -> int:
@@ -127,7 +194,12 @@ def fib_fast_doubling(n: int) -> int:
     Uses identities:
     F(2k) = F(k) * [2*F(k+1) - F(k)]
     F(2k+1) = F(k)² + F(k+1)²
+
+    Delegates to gmpy2.fib (GMP's mpz_fib_ui) when gmpy2 is installed.
     """
+    if gmpy2 is not None:
+        return int(gmpy2.fib(n))
+
     def fib_pair(n: int) -> Tuple[int, int]:
         """Returns (F(n), F(n+1))"""
         if n == 0:
@@ -145,6 +217,21 @@ def fib_fast_doubling(n: int) -> int:
     return fib_pair(n)[0]
 
 
+def _lucas_loop(n: int) -> int:
+    if n == 0:
+        return 2
+    if n == 1:
+        return 1
+
+    a, b = 2, 1
+    for _ in range(2, n + 1):
+        a, b = b, a + b
+    return b
+
+
+_lucas_njit = njit(cache=True)(_lucas_loop)
+
+
 def lucas_number(n: int) -> int:
     """
     Calculate nth Lucas number.
@@ -155,16 +242,29 @@ def lucas_number(n: int) -> int:
     Connected to Fibonacci:
     L(n) = F(n-1) + F(n+1)
     F(n) * L(n) = F(2n)
+
+    Beyond int64 range, uses gmpy2.lucas when gmpy2 is installed.
     """
-    if n == 0:
-        return 2
-    if n == 1:
+    if n <= LUCAS_INT64_LIMIT:
+        return _lucas_njit(n)
+    if gmpy2 is not None:
+        return int(gmpy2.lucas(n))
+    return _lucas_loop(n)
+
+
+def _tribonacci_loop(n: int) -> int:
+    if n < 2:
+        return 0
+    if n == 2:
         return 1
 
-    a, b = 2, 1
-    for _ in range(2, n + 1):
-        a, b = b, a + b
-    return b
+    a, b, c = 0, 0, 1
+    for _ in range(3, n + 1):
+        a, b, c = b, c, a + b + c
+    return c
+
+
+_tribonacci_njit = njit(cache=True)(_tribonacci_loop)
 
 
 def tribonacci(n: int) -> int:
@@ -176,23 +276,31 @@ def tribonacci(n: int) -> int:
 
     Ratio approaches the tribonacci constant: ~1.839
     """
-    if n < 2:
-        return 0
-    if n == 2:
-        return 1
+    if n <= TRIBONACCI_INT64_LIMIT:
+        return _tribonacci_njit(n)
+    return _tribonacci_loop(n)
 
-    a, b, c = 0, 0, 1
-    for _ in range(3, n + 1):
-        a, b, c = b, c, a + b + c
-    return c
+
+def _fib_lucas_triple(n: int) -> Tuple[int, int, int]:
+    """
+    Return (F(n), F(n+1), L(n)) for n >= 0 from one pass of the recurrence.
+
+    L(n) = F(n-1) + F(n+1) = 2F(n+1) - F(n), so it needs no loop of its own.
+    """
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a, b, 2 * b - a
 
 
 def fibonacci_properties(n: int) -> dict:
     """
     Calculate various Fibonacci-related properties for F(n).
     """
-    fib_n = fib_iterative(n)
-    fib_n1 = fib_iterative(n + 1) if n >= 0 else 0
+    if n >= 0:
+        fib_n, fib_n1, lucas_n = _fib_lucas_triple(n)
+    else:
+        fib_n, fib_n1, lucas_n = n, 0, lucas_number(n)
 
     return {
         'n': n,
@@ -200,14 +308,13 @@ def fibonacci_properties(n: int) -> dict:
         'F(n+1)': fib_n1,
         'ratio': fib_n1 / fib_n if fib_n > 0 else None,
         'ratio_error': abs(fib_n1 / fib_n - PHI) if fib_n > 0 else None,
-        'L(n)': lucas_number(n),
+        'L(n)': lucas_n,
         'is_prime': is_prime(fib_n),
         'digit_count': len(str(fib_n))
     }
 
 
-def is_prime(n: int) -> bool:
-    """Simple primality test."""
+def _is_prime_loop(n: int) -> bool:
     if n < 2:
         return False
     if n == 2:
@@ -220,22 +327,57 @@ def is_prime(n: int) -> bool:
     return True
 
 
-def fibonacci_primes(max_index: int) -> List[Tuple[int, int]]:
-    """Find Fibonacci primes up to index max_index."""
-    primes = []
-    for i in range(2, max_index + 1):
-        f = fib_iterative(i)
-        if is_prime(f):
-            primes.append((i, f))
-    return primes
+_is_prime_njit = njit(cache=True)(_is_prime_loop)
 
 
-def gcd_euclidean(a: int, b: int) -> Tuple[int, int]:
+def is_prime(n: int) -> bool:
     """
-    Euclidean algorithm with step count.
+    Primality test.
 
-    Consecutive Fibonacci numbers are the worst case.
+    Uses trial division below TRIAL_DIVISION_LIMIT. Larger n go to
+    gmpy2.is_prime (Miller-Rabin on GMP integers) or sympy.isprime
+    (BPSW) when one of them is installed, else to trial division.
+    """
+    if n >= TRIAL_DIVISION_LIMIT and _library_is_prime is not None:
+        return bool(_library_is_prime(n))
+    if n <= INT64_MAX:
+        return _is_prime_njit(n)
+    return _is_prime_loop(n)
+
+
+@njit(parallel=True, cache=True)
+def _filter_primes(values: np.ndarray) -> np.ndarray:
+    """Trial-division primality flags for an int64 array, one core per chunk."""
+    flags = np.zeros(len(values), dtype=np.bool_)
+    for i in prange(len(values)):
+        flags[i] = _is_prime_njit(values[i])
+    return flags
+
+
+def fibonacci_primes(max_index: int) -> List[Tuple[int, int]]:
+    """
+    Find Fibonacci primes up to index max_index.
+
+    F(m) divides F(n) whenever m divides n, so F(n) can only be prime
+    when n is prime or n == 4. Only those indices are checked, each with
+    a single fast-doubling evaluation. Without a primality library, the
+    int64 candidates (index <= 92) are checked in parallel by a Numba
+    kernel when Numba is installed.
     """
+    indices = [i for i in range(3, max_index + 1) if i == 4 or is_prime(i)]
+    fibs = [fib_fast_doubling(i) for i in indices]
+
+    n_int64 = sum(1 for i in indices if i <= FIB_INT64_LIMIT)
+    if HAVE_NUMBA and _library_is_prime is None and n_int64:
+        flags = _filter_primes(np.array(fibs[:n_int64], dtype=np.int64)).tolist()
+        flags += [is_prime(f) for f in fibs[n_int64:]]
+    else:
+        flags = [is_prime(f) for f in fibs]
+
+    return [(i, f) for i, f, flag in zip(indices, fibs, flags) if flag]
+
+
+def _gcd_euclidean_loop(a: int, b: int) -> Tuple[int, int]:
     steps = 0
     while b:
         a, b = b, a % b
@@ -243,18 +385,34 @@ def gcd_euclidean(a: int, b: int) -> Tuple[int, int]:
     return a, steps
 
 
+_gcd_euclidean_njit = njit(cache=True)(_gcd_euclidean_loop)
+
+
+def gcd_euclidean(a: int, b: int) -> Tuple[int, int]:
+    """
+    Euclidean algorithm with step count.
+
+    Consecutive Fibonacci numbers are the worst case.
+    """
+    if 0 <= a <= INT64_MAX and 0 <= b <= INT64_MAX:
+        return _gcd_euclidean_njit(a, b)
+    return _gcd_euclidean_loop(a, b)
+
+
 def benchmark_algorithms(n: int = 35) -> dict:
     """Benchmark different Fibonacci implementations."""
     results = {}
 
-    # Skip recursive for large n (too slow)
-    if n <= 35:
+    # Skip naive recursion for large n (too slow)
+    if n <= NAIVE_RECURSION_LIMIT:
         start = time.perf_counter()
-        fib_recursive(n)
+        fib_recursive_naive(n)
         results['recursive'] = time.perf_counter() - start
     else:
         results['recursive'] = 'skipped (too slow)'
 
+    # Start from a cold cache so the timing reflects the real work
+    fib_memoized.cache_clear()
     start = time.perf_counter()
     fib_memoized(n)
     results['memoized'] = time.perf_counter() - start
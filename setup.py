@@ -0,0 +1,14 @@
+"""Build the optional C accelerator; all package metadata lives in pyproject.toml."""
+
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=[
+        Extension(
+            "golden_ratio._golden_ratio_c",
+            sources=["src/golden_ratio/_golden_ratio_c.c"],
+            # Installs without a C compiler fall back to the pure Python code
+            optional=True,
+        )
+    ]
+)
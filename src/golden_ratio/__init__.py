@@ -10,26 +10,76 @@ from golden_ratio.constants import (
     PSI,
     GOLDEN_ANGLE,
     GOLDEN_ANGLE_DEGREES,
+    PHI_POWERS,
+    INV_PHI_POWERS,
 )
-from golden_ratio.core import (
-    GoldenRatio,
-    GoldenRectangle,
-)
-from golden_ratio.fibonacci import (
-    Fibonacci,
-    fib_iterative,
-    fib_binet,
-    fib_generator,
-    fib_matrix,
-    fib_fast_doubling,
-    lucas_number,
-    tribonacci,
-    is_fibonacci,
-)
-from golden_ratio.design import DesignScale
-from golden_ratio.trading import FibonacciTrading
-from golden_ratio.phyllotaxis import Phyllotaxis
-from golden_ratio.hashing import GoldenHash
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from golden_ratio.core import (
+        GoldenRatio,
+        GoldenRectangle,
+        RectangleResult,
+    )
+    from golden_ratio.design import DesignScale
+    from golden_ratio.fibonacci import (
+        Fibonacci,
+        fib_binet,
+        fib_fast_doubling,
+        fib_generator,
+        fib_iterative,
+        fib_matrix,
+        is_fibonacci,
+        lucas_number,
+        tribonacci,
+    )
+    from golden_ratio.hashing import GoldenHash
+    from golden_ratio.phyllotaxis import Phyllotaxis
+    from golden_ratio.trading import FibonacciTrading, Retracement
+
+# Submodules are imported on first attribute access so that the CLI only
+# pays for the parts of the library a command actually uses.
+_LAZY_ATTRS = {
+    "GoldenRatio": "golden_ratio.core",
+    "GoldenRectangle": "golden_ratio.core",
+    "RectangleResult": "golden_ratio.core",
+    "Fibonacci": "golden_ratio.fibonacci",
+    "fib_iterative": "golden_ratio.fibonacci",
+    "fib_binet": "golden_ratio.fibonacci",
+    "fib_generator": "golden_ratio.fibonacci",
+    "fib_matrix": "golden_ratio.fibonacci",
+    "fib_fast_doubling": "golden_ratio.fibonacci",
+    "lucas_number": "golden_ratio.fibonacci",
+    "tribonacci": "golden_ratio.fibonacci",
+    "is_fibonacci": "golden_ratio.fibonacci",
+    "DesignScale": "golden_ratio.design",
+    "FibonacciTrading": "golden_ratio.trading",
+    "Retracement": "golden_ratio.trading",
+    "Phyllotaxis": "golden_ratio.phyllotaxis",
+    "GoldenHash": "golden_ratio.hashing",
+}
+
+# Submodules that `import golden_ratio` used to load, still reachable as attributes
+_LAZY_SUBMODULES = ("core", "design", "fibonacci", "hashing", "phyllotaxis", "trading")
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names and submodules on first access."""
+    import importlib
+
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """List the lazily exported names alongside the loaded ones."""
+    return sorted(set(globals()) | set(__all__) | set(_LAZY_SUBMODULES))
+
 
 __version__ = "1.0.0"
 __all__ = [
@@ -38,9 +88,12 @@ __all__ = [
     "PSI",
     "GOLDEN_ANGLE",
     "GOLDEN_ANGLE_DEGREES",
+    "PHI_POWERS",
+    "INV_PHI_POWERS",
     # Core classes
     "GoldenRatio",
     "GoldenRectangle",
+    "RectangleResult",
     # Fibonacci
     "Fibonacci",
     "fib_iterative",
@@ -55,6 +108,7 @@ __all__ = [
     "DesignScale",
     # Trading
     "FibonacciTrading",
+    "Retracement",
     # Phyllotaxis
     "Phyllotaxis",
     # Hashing
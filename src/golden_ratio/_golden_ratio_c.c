@@ -0,0 +1,128 @@
+/*
+ * Optional C accelerator for golden_ratio.fibonacci.
+ *
+ * is_prime works in 64-bit unsigned arithmetic, so golden_ratio.fibonacci
+ * only calls it for n < 2^64 and tests larger n in Python.
+ * The module is built by setup.py when a C compiler is available and is
+ * skipped otherwise.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+
+/* (a * b) mod m without overflow */
+static uint64_t
+mulmod(uint64_t a, uint64_t b, uint64_t m)
+{
+#ifdef __SIZEOF_INT128__
+    return (uint64_t)((unsigned __int128)a * b % m);
+#else
+    uint64_t result = 0;
+    a %= m;
+    while (b) {
+        if (b & 1) {
+            result = (result >= m - a) ? result - (m - a) : result + a;
+        }
+        a = (a >= m - a) ? a - (m - a) : a + a;
+        b >>= 1;
+    }
+    return result;
+#endif
+}
+
+static uint64_t
+powmod(uint64_t base, uint64_t exp, uint64_t m)
+{
+    uint64_t result = 1;
+    base %= m;
+    while (exp) {
+        if (exp & 1) {
+            result = mulmod(result, base, m);
+        }
+        base = mulmod(base, base, m);
+        exp >>= 1;
+    }
+    return result;
+}
+
+/* The first 12 primes are enough Miller-Rabin witnesses for every n < 2^64 */
+static const uint64_t WITNESSES[] = {2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37};
+#define N_WITNESSES (sizeof(WITNESSES) / sizeof(WITNESSES[0]))
+
+static int
+is_prime_u64(uint64_t n)
+{
+    if (n < 2) {
+        return 0;
+    }
+    for (size_t i = 0; i < N_WITNESSES; i++) {
+        if (n % WITNESSES[i] == 0) {
+            return n == WITNESSES[i];
+        }
+    }
+
+    uint64_t d = n - 1;
+    int s = 0;
+    while ((d & 1) == 0) {
+        d >>= 1;
+        s++;
+    }
+
+    for (size_t i = 0; i < N_WITNESSES; i++) {
+        uint64_t x = powmod(WITNESSES[i], d, n);
+        if (x == 1 || x == n - 1) {
+            continue;
+        }
+        int composite = 1;
+        for (int r = 1; r < s; r++) {
+            x = mulmod(x, x, n);
+            if (x == n - 1) {
+                composite = 0;
+                break;
+            }
+        }
+        if (composite) {
+            return 0;
+        }
+    }
+    return 1;
+}
+
+static PyObject *
+is_prime(PyObject *self, PyObject *arg)
+{
+    PyObject *index = PyNumber_Index(arg);
+    if (index == NULL) {
+        return NULL;
+    }
+    uint64_t n = PyLong_AsUnsignedLongLong(index);
+    Py_DECREF(index);
+    if (n == (uint64_t)-1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    return PyBool_FromLong(is_prime_u64(n));
+}
+
+static PyMethodDef methods[] = {
+    {"is_prime", is_prime, METH_O, "Deterministic Miller-Rabin for 0 <= n < 2**64."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef module = {
+    PyModuleDef_HEAD_INIT,
+    "golden_ratio._golden_ratio_c",
+    "Optional C accelerator for golden_ratio.fibonacci.",
+    -1,
+    methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+};
+
+PyMODINIT_FUNC
+PyInit__golden_ratio_c(void)
+{
+    return PyModule_Create(&module);
+}
@@ -6,14 +6,13 @@ A command-line interface for golden ratio calculations.
 
 import argparse
 import sys
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Tuple
 
 from golden_ratio import __version__
 from golden_ratio.constants import PHI, GOLDEN_ANGLE_DEGREES
-from golden_ratio.core import GoldenRatio, GoldenRectangle
-from golden_ratio.fibonacci import Fibonacci, fib_fast_doubling, lucas_number
-from golden_ratio.design import DesignScale
-from golden_ratio.trading import FibonacciTrading
+
+# Library modules are imported inside the command that needs them, keeping
+# start-up cheap for commands that touch only a small part of the package.
 
 
 def print_header(title: str) -> None:
@@ -31,8 +30,17 @@ def print_section(title: str) -> None:
     print("-" * 40)
 
 
+def print_lines(lines: Iterable[str]) -> None:
+    """Print a block of lines with a single write to stdout."""
+    block = "\n".join(lines)
+    if block:
+        sys.stdout.write(block + "\n")
+
+
 def cmd_info(args: argparse.Namespace) -> None:
     """Display golden ratio information."""
+    from golden_ratio.core import GoldenRatio
+
     print_header("GOLDEN RATIO INFORMATION")
     print()
     print(f"  phi (φ)           = {PHI}")
@@ -47,8 +55,25 @@ def cmd_info(args: argparse.Namespace) -> None:
     print("  φ = [1; 1, 1, 1, ...] (continued fraction)")
 
 
+def _iter_ratios(max_i: int) -> Iterator[Tuple[int, int, int, float, float]]:
+    """Yield (i, F(i-1), F(i), ratio, error from phi) for 3 <= i <= max_i.
+
+    Stops early once the ratio equals phi in double precision (i = 41),
+    since every later row would be identical.
+    """
+    a, b = 1, 2  # F(2), F(3)
+    for i in range(3, max_i + 1):
+        ratio = b / a
+        yield i, a, b, ratio, abs(ratio - PHI)
+        if ratio == PHI:
+            return
+        a, b = b, a + b
+
+
 def cmd_fibonacci(args: argparse.Namespace) -> None:
     """Generate Fibonacci sequence."""
+    from golden_ratio.fibonacci import Fibonacci
+
     n = args.count
     print_header(f"FIBONACCI SEQUENCE (first {n})")
     print()
@@ -58,14 +83,16 @@ def cmd_fibonacci(args: argparse.Namespace) -> None:
 
     if args.ratios:
         print_section("Ratio Convergence to φ")
-        for i in range(2, min(n, 15)):
-            ratio = fib[i] / fib[i - 1]
-            error = abs(ratio - PHI)
-            print(f"  F({i})/F({i-1}) = {fib[i]}/{fib[i-1]} = {ratio:.10f}, error = {error:.2e}")
+        print_lines(
+            f"  F({i})/F({i-1}) = {cur}/{prev} = {ratio:.10f}, error = {error:.2e}"
+            for i, prev, cur, ratio, error in _iter_ratios(n)
+        )
 
 
 def cmd_rectangle(args: argparse.Namespace) -> None:
     """Calculate golden rectangle dimensions."""
+    from golden_ratio.core import GoldenRectangle
+
     print_header("GOLDEN RECTANGLE")
     print()
 
@@ -83,28 +110,30 @@ def cmd_rectangle(args: argparse.Namespace) -> None:
 
 def cmd_scale(args: argparse.Namespace) -> None:
     """Generate design scales."""
+    from golden_ratio.design import DesignScale
+
     base = args.base
     print_header(f"DESIGN SCALES (base: {base}px)")
 
     print_section("Typography Scale")
     type_scale = DesignScale.type_scale(base)
-    for name, size in type_scale.items():
-        print(f"  {name:10}: {size}px")
+    print_lines(f"  {name:10}: {size}px" for name, size in type_scale.items())
 
     print_section("Spacing Scale")
     spacing = DesignScale.spacing_scale(base)
-    for name, size in sorted(spacing.items()):
-        print(f"  {name:10}: {size}px")
+    print_lines(f"  {name:10}: {size}px" for name, size in sorted(spacing.items()))
 
     print_section("Layout Divisions (width: 1200px)")
     layout = DesignScale.layout_divisions(1200)
-    for key, value in layout.items():
-        unit = "%" if "percent" in key else "px"
-        print(f"  {key:18}: {value}{unit}")
+    print_lines(
+        f"  {key:18}: {value}{'%' if 'percent' in key else 'px'}" for key, value in layout.items()
+    )
 
 
 def cmd_trading(args: argparse.Namespace) -> None:
     """Calculate Fibonacci trading levels."""
+    from golden_ratio.trading import FibonacciTrading
+
     high = args.high
     low = args.low
     is_uptrend = not args.downtrend
@@ -113,22 +142,21 @@ def cmd_trading(args: argparse.Namespace) -> None:
 
     print_section("Retracement Levels")
     retracements = FibonacciTrading.retracements(high, low, is_uptrend)
-    for level, price in retracements.items():
-        print(f"  {level:8}: ${price:.4f}")
+    print_lines(f"  {level:8}: ${price:.4f}" for level, price in retracements.items())
 
     print_section("Extension Levels")
     extensions = FibonacciTrading.extensions(high, low, is_uptrend)
-    for level, price in extensions.items():
-        print(f"  {level:8}: ${price:.4f}")
+    print_lines(f"  {level:8}: ${price:.4f}" for level, price in extensions.items())
 
     print_section("Golden Pocket")
     pocket = FibonacciTrading.golden_pocket(high, low, is_uptrend)
-    for key, value in pocket.items():
-        print(f"  {key:10}: ${value:.4f}")
+    print_lines(f"  {key:10}: ${value:.4f}" for key, value in pocket.items())
 
 
 def cmd_nth(args: argparse.Namespace) -> None:
     """Calculate nth Fibonacci/Lucas number."""
+    from golden_ratio.fibonacci import fib_fast_doubling, lucas_number
+
     n = args.n
     print_header(f"CALCULATING F({n}) AND L({n})")
     print()
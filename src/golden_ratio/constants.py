@@ -1,20 +1,39 @@
 """
 Mathematical constants related to the golden ratio.
+
+Scalar values are written out as double-precision literals rather than
+computed at import time; each comment gives the defining formula.
 """
 
-import math
+from typing import Tuple
 
 # The golden ratio: phi = (1 + sqrt(5)) / 2
-PHI: float = (1 + math.sqrt(5)) / 2  # 1.6180339887498948482...
+PHI: float = 1.618033988749895  # 1.6180339887498948482...
 
 # The conjugate of phi: psi = (1 - sqrt(5)) / 2
-PSI: float = (1 - math.sqrt(5)) / 2  # -0.6180339887498948482...
+PSI: float = -0.6180339887498949  # -0.6180339887498948482...
+
+# The golden angle in radians: pi * (3 - sqrt(5)) (~137.5 degrees)
+GOLDEN_ANGLE: float = 2.399963229728653  # ~2.399963 rad
+
+# The golden angle in degrees: 360 / phi^2
+GOLDEN_ANGLE_DEGREES: float = 137.50776405003785  # ~137.5077 degrees
+
+# Inverse of phi: (sqrt(5) - 1) / 2 (also equals phi - 1)
+INV_PHI: float = 0.6180339887498949  # ~0.618
+
+# phi squared: phi^2 = phi + 1
+PHI_SQ: float = 2.618033988749895  # ~2.618
+
+# Square root of 5 and its reciprocal, as used in Binet's formula
+SQRT5: float = 2.23606797749979  # ~2.236
+INV_SQRT5: float = 0.4472135954999579  # 1 / sqrt(5), ~0.447
 
-# The golden angle in radians (~137.5 degrees)
-GOLDEN_ANGLE: float = math.pi * (3 - math.sqrt(5))  # ~2.399963 rad
+# Number of entries in the precomputed power tables
+PHI_POWERS_SIZE: int = 64
 
-# The golden angle in degrees
-GOLDEN_ANGLE_DEGREES: float = 360 / (PHI**2)  # ~137.5077 degrees
+# phi^i for 0 <= i < PHI_POWERS_SIZE, shared by the scale and power helpers
+PHI_POWERS: Tuple[float, ...] = tuple(PHI**i for i in range(PHI_POWERS_SIZE))
 
-# Inverse of phi (also equals phi - 1)
-INV_PHI: float = (math.sqrt(5) - 1) / 2  # ~0.618
+# phi^-i for 0 <= i < PHI_POWERS_SIZE
+INV_PHI_POWERS: Tuple[float, ...] = tuple(1 / p for p in PHI_POWERS)
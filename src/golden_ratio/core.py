@@ -2,9 +2,33 @@
 Core golden ratio calculations and utilities.
 """
 
-from typing import Dict, List
+import math
+from typing import Dict, List, NamedTuple
 
-from golden_ratio.constants import PHI
+import numpy as np
+
+from golden_ratio.constants import (
+    INV_PHI,
+    INV_PHI_POWERS,
+    PHI,
+    PHI_POWERS,
+    PHI_POWERS_SIZE,
+)
+
+# phi^-k for k < PHI_POWERS_SIZE, for slicing whole runs of subdivisions
+_INV_PHI_POW_ARRAY = np.array(INV_PHI_POWERS, dtype=np.float64)
+
+# Relative tolerance for treating a rectangle as exactly golden
+GOLDEN_TOLERANCE = 1e-9
+
+
+class RectangleResult(NamedTuple):
+    """Golden rectangle dimensions, as returned by the *_tuple constructors."""
+
+    width: float
+    height: float
+    area: float
+    ratio: float
 
 
 class GoldenRatio:
@@ -26,7 +50,7 @@ class GoldenRatio:
         Returns:
             The inverse of phi (approximately 0.618033988749895).
         """
-        return 1 / PHI
+        return INV_PHI
 
     @staticmethod
     def phi_power(n: int) -> float:
@@ -38,6 +62,10 @@ class GoldenRatio:
         Returns:
             phi^n.
         """
+        if 0 <= n < PHI_POWERS_SIZE:
+            return PHI_POWERS[n]
+        if -PHI_POWERS_SIZE < n < 0:
+            return INV_PHI_POWERS[-n]
         return PHI**n
 
     @staticmethod
@@ -71,13 +99,7 @@ class GoldenRectangle:
         Returns:
             Dictionary with width, height, area, and ratio.
         """
-        height = width / PHI
-        return {
-            "width": width,
-            "height": round(height, 4),
-            "area": round(width * height, 4),
-            "ratio": PHI,
-        }
+        return GoldenRectangle.from_width_tuple(width)._asdict()
 
     @staticmethod
     def from_height(height: float) -> Dict[str, float]:
@@ -89,13 +111,47 @@ class GoldenRectangle:
         Returns:
             Dictionary with width, height, area, and ratio.
         """
+        return GoldenRectangle.from_height_tuple(height)._asdict()
+
+    @staticmethod
+    def from_width_tuple(width: float) -> RectangleResult:
+        """Calculate golden rectangle dimensions from width as a named tuple.
+
+        Same values as from_width, without building a dict per call.
+
+        Args:
+            width: The width of the rectangle.
+
+        Returns:
+            RectangleResult with width, height, area, and ratio.
+        """
+        height = width * INV_PHI
+        return RectangleResult(
+            width=width,
+            height=round(height, 4),
+            area=round(width * height, 4),
+            ratio=PHI,
+        )
+
+    @staticmethod
+    def from_height_tuple(height: float) -> RectangleResult:
+        """Calculate golden rectangle dimensions from height as a named tuple.
+
+        Same values as from_height, without building a dict per call.
+
+        Args:
+            height: The height of the rectangle.
+
+        Returns:
+            RectangleResult with width, height, area, and ratio.
+        """
         width = height * PHI
-        return {
-            "width": round(width, 4),
-            "height": height,
-            "area": round(width * height, 4),
-            "ratio": PHI,
-        }
+        return RectangleResult(
+            width=round(width, 4),
+            height=height,
+            area=round(width * height, 4),
+            ratio=PHI,
+        )
 
     @staticmethod
     def subdivide(width: float, height: float, n: int = 5) -> List[Dict[str, float]]:
@@ -113,15 +169,53 @@ class GoldenRectangle:
         Returns:
             List of squares with their properties.
         """
-        subdivisions = []
+        return [
+            {"type": "square", "side": side, "iteration": i}
+            for i, side in enumerate(GoldenRectangle.subdivide_arrays(width, height, n).tolist())
+        ]
+
+    @staticmethod
+    def subdivide_arrays(width: float, height: float, n: int = 5) -> np.ndarray:
+        """Subdivide a golden rectangle, returning only the square sides.
+
+        Same squares as subdivide, stored as one float64 array: the
+        iteration is the index and every entry is a square. For a golden
+        rectangle (within GOLDEN_TOLERANCE) the k-th side is exactly
+        short_side / phi^k, so the sides are read off the power table
+        instead of by repeated subtraction, which also keeps them from
+        accumulating rounding error.
+
+        Args:
+            width: Rectangle width.
+            height: Rectangle height.
+            n: Number of subdivisions.
+
+        Returns:
+            Array of shape (n,) with the side of each square.
+        """
+        short, long = min(width, height), max(width, height)
+        if n > 0 and short > 0 and abs(long - short * PHI) <= GOLDEN_TOLERANCE * long:
+            if n <= PHI_POWERS_SIZE:
+                return short * _INV_PHI_POW_ARRAY[:n]
+            return short * np.power(INV_PHI, np.arange(n, dtype=np.float64))
+
+        sides = np.empty(max(n, 0), dtype=np.float64)
         w, h = width, height
+        i = 0
 
-        for i in range(n):
+        # A run of equal squares is cut in one step: k squares of side h
+        # come off while w > h, and k squares of side w while h >= w.
+        while i < n:
             if w > h:
-                subdivisions.append({"type": "square", "side": h, "iteration": i})
-                w = w - h
+                k = max(math.ceil(w / h) - 1, 1) if h > 0 else n - i
+                k = min(k, n - i)
+                sides[i : i + k] = h
+                w = w - k * h
             else:
-                subdivisions.append({"type": "square", "side": w, "iteration": i})
-                h = h - w
+                k = max(math.floor(h / w), 1) if w > 0 else n - i
+                k = min(k, n - i)
+                sides[i : i + k] = w
+                h = h - k * w
+            i += k
 
-        return subdivisions
+        return sides
@@ -5,9 +5,33 @@ Generate typography scales, spacing systems, and layout proportions
 based on the golden ratio for harmonious design.
 """
 
-from typing import Dict
+from typing import Dict, Tuple
 
-from golden_ratio.constants import PHI
+import numpy as np
+
+from golden_ratio.constants import INV_PHI_POWERS, PHI, PHI_POWERS, PHI_POWERS_SIZE, PHI_SQ
+
+# PHI**i for -PHI_POWERS_SIZE < i < PHI_POWERS_SIZE; phi^0 sits at index PHI_POWERS_SIZE - 1.
+# Built with ** (not 1 / PHI**i) so modular_scale matches base * PHI**i exactly.
+_PHI_POW_ARRAY = np.array(
+    [PHI**i for i in range(1 - PHI_POWERS_SIZE, PHI_POWERS_SIZE)], dtype=np.float64
+)
+
+# Shares of a golden layout: phi / (1 + phi) and 1 / (1 + phi), with 1 + phi = phi^2
+_MAIN_FRACTION = PHI / PHI_SQ
+_SIDEBAR_FRACTION = 1 / PHI_SQ
+
+
+def _phi_powers(count: int) -> Tuple[float, ...]:
+    """Return at least phi^0..phi^(count - 1), extending the shared table if needed."""
+    if count <= PHI_POWERS_SIZE:
+        return PHI_POWERS
+    powers = list(PHI_POWERS)
+    current = powers[-1]
+    while len(powers) < count:
+        current *= PHI
+        powers.append(current)
+    return tuple(powers)
 
 
 class DesignScale:
@@ -32,13 +56,18 @@ class DesignScale:
             >>> print(scale['lg1'])  # 25.89
             >>> print(scale['sm1'])  # 9.89
         """
+        powers = _phi_powers(n_larger + 1)
+        inv_powers = INV_PHI_POWERS
+        if n_smaller >= PHI_POWERS_SIZE:
+            inv_powers = tuple(1 / p for p in _phi_powers(n_smaller + 1))
+
         sizes = {"base": base}
 
         for i in range(1, n_larger + 1):
-            sizes[f"lg{i}"] = round(base * (PHI**i), 2)
+            sizes[f"lg{i}"] = round(base * powers[i], 2)
 
         for i in range(1, n_smaller + 1):
-            sizes[f"sm{i}"] = round(base / (PHI**i), 2)
+            sizes[f"sm{i}"] = round(base * inv_powers[i], 2)
 
         return sizes
 
@@ -58,14 +87,16 @@ class DesignScale:
             >>> print(scale['h1'])  # ~67.77
             >>> print(scale['body'])  # 16
         """
+        powers = _phi_powers(levels + 1)
+
         scale = {"body": base}
 
         for i in range(1, levels + 1):
-            size = base * (PHI**i)
+            size = base * powers[i]
             scale[f"h{levels - i + 1}"] = round(size, 2)
 
-        scale["small"] = round(base / PHI, 2)
-        scale["tiny"] = round(base / (PHI**2), 2)
+        scale["small"] = round(base * INV_PHI_POWERS[1], 2)
+        scale["tiny"] = round(base * INV_PHI_POWERS[2], 2)
 
         return scale
 
@@ -87,15 +118,12 @@ class DesignScale:
             >>> print(layout['main'])  # ~741.64
             >>> print(layout['sidebar'])  # ~458.36
         """
-        main = total_width * PHI / (1 + PHI)
-        sidebar = total_width / (1 + PHI)
-
         return {
             "total": total_width,
-            "main": round(main, 2),
-            "sidebar": round(sidebar, 2),
-            "main_percent": round(100 * PHI / (1 + PHI), 2),
-            "sidebar_percent": round(100 / (1 + PHI), 2),
+            "main": round(total_width * _MAIN_FRACTION, 2),
+            "sidebar": round(total_width * _SIDEBAR_FRACTION, 2),
+            "main_percent": round(100 * _MAIN_FRACTION, 2),
+            "sidebar_percent": round(100 * _SIDEBAR_FRACTION, 2),
         }
 
     @staticmethod
@@ -127,8 +155,26 @@ class DesignScale:
 
         Returns:
             Dictionary mapping step numbers to values.
+
+        Raises:
+            ZeroDivisionError: If ratio is 0 and steps is positive.
+            OverflowError: If a power of a finite ratio overflows a float.
         """
-        scale = {}
-        for i in range(-steps, steps + 1):
-            scale[i] = round(base * (ratio**i), 2)
-        return scale
+        idx = np.arange(-steps, steps + 1, dtype=np.int64)
+        if ratio == PHI and steps < PHI_POWERS_SIZE:
+            centre = PHI_POWERS_SIZE - 1
+            powers = _PHI_POW_ARRAY[centre - steps : centre + steps + 1]
+        else:
+            # Raise where ratio**i did, instead of letting NumPy return inf
+            if ratio == 0 and steps > 0:
+                raise ZeroDivisionError("0.0 cannot be raised to a negative power")
+            with np.errstate(over="ignore"):
+                powers = np.power(float(ratio), idx, dtype=np.float64)
+            if np.isfinite(ratio) and np.isinf(powers).any():
+                raise OverflowError(f"ratio {ratio!r} to the power ±{steps} overflows a float")
+        # Only the multiply is vectorized; builtin round() keeps the same
+        # half-way rounding as the other scales (np.round differs on ties).
+        # A product past the float range is inf, as base * ratio**i was
+        with np.errstate(over="ignore"):
+            values = (base * powers).tolist()
+        return dict(zip(idx.tolist(), [round(v, 2) for v in values]))
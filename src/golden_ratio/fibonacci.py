@@ -6,12 +6,61 @@ each with different time and space complexity trade-offs.
 """
 
 import math
+import operator
 from functools import lru_cache
-from typing import Generator, List, Tuple
+from typing import TYPE_CHECKING, FrozenSet, Generator, List, Tuple
 
-import numpy as np
+from golden_ratio.constants import INV_SQRT5, PHI, PSI
 
-from golden_ratio.constants import PHI, PSI
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    from gmpy2 import is_bpsw_prp as _gmpy2_is_bpsw_prp  # type: ignore[import-not-found]
+    from gmpy2 import mpz
+except ImportError:  # GMP integers are optional (the "fast" extra)
+    mpz = int
+    _gmpy2_is_bpsw_prp = None
+
+try:
+    from golden_ratio import _golden_ratio_c  # type: ignore[attr-defined]
+except ImportError:  # The C accelerator is only built when a compiler is available
+    _golden_ratio_c = None
+
+
+def _recurrence_table(initial: Tuple[int, ...], size: int) -> Tuple[int, ...]:
+    """Return the first size terms of a sequence where each term sums the previous len(initial)."""
+    table = list(initial)
+    order = len(initial)
+    while len(table) < size:
+        table.append(sum(table[-order:]))
+    return tuple(table[:size])
+
+
+# Largest indices whose values fit in a signed 64-bit integer
+FIB_INT64_LIMIT = 92
+LUCAS_INT64_LIMIT = 90
+TRIBONACCI_INT64_LIMIT = 74
+
+# F(0)..F(92), L(0)..L(90) and T(0)..T(74): every value below 2^63, so the
+# common small indices are a tuple lookup
+_FIB_TABLE: Tuple[int, ...] = _recurrence_table((0, 1), FIB_INT64_LIMIT + 1)
+_LUCAS_TABLE: Tuple[int, ...] = _recurrence_table((2, 1), LUCAS_INT64_LIMIT + 1)
+_TRIBONACCI_TABLE: Tuple[int, ...] = _recurrence_table((0, 0, 1), TRIBONACCI_INT64_LIMIT + 1)
+_FIB_SET: FrozenSet[int] = frozenset(_FIB_TABLE)
+
+# Largest n for which Binet's formula in float64 still rounds to F(n)
+BINET_EXACT_LIMIT = 70
+
+# Longest Fibonacci prefix computed so far: _FIB_CACHE[i] == F(i)
+_FIB_CACHE: List[int] = list(_FIB_TABLE)
+
+
+def _extend_fib(n: int) -> None:
+    """Grow the shared Fibonacci cache so that it holds F(0)..F(n)."""
+    cache = _FIB_CACHE
+    while len(cache) <= n:
+        cache.append(cache[-1] + cache[-2])
 
 
 class Fibonacci:
@@ -29,13 +78,8 @@ class Fibonacci:
         """
         if n <= 0:
             return []
-        if n == 1:
-            return [1]
-
-        fib = [1, 1]
-        for _ in range(2, n):
-            fib.append(fib[-1] + fib[-2])
-        return fib
+        _extend_fib(n)
+        return _FIB_CACHE[1 : n + 1]
 
     @staticmethod
     def nth(n: int) -> int:
@@ -49,13 +93,8 @@ class Fibonacci:
         """
         if n <= 0:
             return 0
-        if n <= 2:
-            return 1
-
-        a, b = 1, 1
-        for _ in range(2, n):
-            a, b = b, a + b
-        return b
+        _extend_fib(n)
+        return _FIB_CACHE[n]
 
     @staticmethod
     def nth_binet(n: int) -> int:
@@ -69,7 +108,7 @@ class Fibonacci:
         Returns:
             The nth Fibonacci number (approximate for large n).
         """
-        return round((PHI**n - PSI**n) / math.sqrt(5))
+        return round((PHI**n - PSI**n) * INV_SQRT5)
 
     @staticmethod
     def ratio_convergence(n: int = 20) -> List[Tuple[int, float, float]]:
@@ -81,19 +120,46 @@ class Fibonacci:
         Returns:
             List of tuples (index, ratio, error from phi).
         """
-        fib = Fibonacci.sequence(n + 1)
+        # a, b = F(i), F(i+1); int / int stays exact-then-rounded for any size
         convergence = []
-        for i in range(1, len(fib)):
-            ratio = fib[i] / fib[i - 1]
-            error = abs(ratio - PHI)
-            convergence.append((i, round(ratio, 10), error))
+        a, b = 1, 1
+        for i in range(1, n + 1):
+            ratio = b / a
+            convergence.append((i, round(ratio, 10), abs(ratio - PHI)))
+            a, b = b, a + b
         return convergence
 
+    @staticmethod
+    def ratio_convergence_arrays(n: int = 20) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Show how Fibonacci ratios converge to phi, as parallel arrays.
+
+        Same data as ratio_convergence in structure-of-arrays form, with
+        the ratios left unrounded.
+
+        Args:
+            n: Number of ratios to compute.
+
+        Returns:
+            Tuple (indices, ratios, errors) of arrays of shape (n,), where
+            ratios[k] = F(k+2) / F(k+1) and errors = |ratios - phi|.
+        """
+        # Imported here so that importing this module does not pull in NumPy
+        import numpy as np
+
+        count = max(n, 0)
+        _extend_fib(count + 1)
+        fib = _FIB_CACHE
+        # int / int division, so the ratio is exact even where F(i) overflows a float
+        ratios = np.fromiter(
+            (fib[i + 1] / fib[i] for i in range(1, count + 1)), dtype=np.float64, count=count
+        )
+        return np.arange(1, count + 1), ratios, np.abs(ratios - PHI)
+
 
 def fib_iterative(n: int) -> int:
     """Calculate nth Fibonacci number iteratively.
 
-    Time: O(n), Space: O(1)
+    Time: O(n), Space: O(1); O(1) lookup for n <= 92
 
     Args:
         n: The index of the Fibonacci number (0-based).
@@ -103,6 +169,8 @@ def fib_iterative(n: int) -> int:
     """
     if n <= 1:
         return n
+    if n < len(_FIB_TABLE):
+        return _FIB_TABLE[n]
 
     a, b = 0, 1
     for _ in range(2, n + 1):
@@ -110,11 +178,14 @@ def fib_iterative(n: int) -> int:
     return b
 
 
-@lru_cache(maxsize=None)
 def fib_memoized(n: int) -> int:
     """Calculate nth Fibonacci number with memoization.
 
-    Time: O(n), Space: O(n)
+    Time: O(n) for the first call, O(1) once F(n) is cached; Space: O(n)
+
+    The memo is the module-wide Fibonacci prefix shared with
+    Fibonacci.sequence and Fibonacci.nth. It is filled iteratively, so
+    there is no recursion limit, and it only ever grows.
 
     Args:
         n: The index of the Fibonacci number (0-based).
@@ -124,7 +195,8 @@ def fib_memoized(n: int) -> int:
     """
     if n <= 1:
         return n
-    return fib_memoized(n - 1) + fib_memoized(n - 2)
+    _extend_fib(n)
+    return _FIB_CACHE[n]
 
 
 def fib_generator(n: int) -> Generator[int, None, None]:
@@ -148,7 +220,9 @@ def fib_binet(n: int) -> int:
     """Calculate nth Fibonacci using Binet's formula.
 
     Time: O(1) (but O(log n) for exponentiation), Space: O(1)
-    Warning: Loses precision for n > ~70.
+
+    Float64 Binet stops rounding to the right integer past n = 70, so
+    larger n return the exact fast-doubling result instead.
 
     Args:
         n: The index of the Fibonacci number.
@@ -156,7 +230,9 @@ def fib_binet(n: int) -> int:
     Returns:
         The nth Fibonacci number.
     """
-    return round((PHI**n - PSI**n) / math.sqrt(5))
+    if n > BINET_EXACT_LIMIT:
+        return fib_fast_doubling(n)
+    return round((PHI**n - PSI**n) * INV_SQRT5)
 
 
 def fib_matrix(n: int) -> int:
@@ -167,68 +243,64 @@ def fib_matrix(n: int) -> int:
     Uses the identity:
     [[1, 1], [1, 0]]^n = [[F(n+1), F(n)], [F(n), F(n-1)]]
 
+    The power is symmetric, so it is held as three scalars
+    (v1, v2, v3) = (F(k+1), F(k), F(k-1)). Squaring takes three big
+    multiplications and each 1 bit of n steps k up by one.
+
     Args:
         n: The index of the Fibonacci number.
 
     Returns:
         The nth Fibonacci number.
     """
-    if n <= 1:
+    if n < 2:
         return n
 
-    def matrix_mult(a: np.ndarray, b: np.ndarray) -> np.ndarray:
-        return np.array(
-            [
-                [a[0, 0] * b[0, 0] + a[0, 1] * b[1, 0], a[0, 0] * b[0, 1] + a[0, 1] * b[1, 1]],
-                [a[1, 0] * b[0, 0] + a[1, 1] * b[1, 0], a[1, 0] * b[0, 1] + a[1, 1] * b[1, 1]],
-            ],
-            dtype=object,
-        )
-
-    def matrix_pow(m: np.ndarray, p: int) -> np.ndarray:
-        if p == 1:
-            return m
-        if p % 2 == 0:
-            half = matrix_pow(m, p // 2)
-            return matrix_mult(half, half)
-        return matrix_mult(m, matrix_pow(m, p - 1))
-
-    f = np.array([[1, 1], [1, 0]], dtype=object)
-    result = matrix_pow(f, n)
-    return result[0, 1]
+    v1, v2, v3 = 1, 1, 0
+    for rec in bin(n)[3:]:
+        calc = v2 * v2
+        v1, v2, v3 = v1 * v1 + calc, (v1 + v3) * v2, calc + v3 * v3
+        if rec == "1":
+            v1, v2, v3 = v1 + v2, v1, v2
+    return v2
 
 
 def fib_fast_doubling(n: int) -> int:
     """Calculate nth Fibonacci using fast doubling method.
 
-    Time: O(log n), Space: O(log n) for recursion
+    Time: O(log n), Space: O(1)
 
     Uses identities:
     F(2k) = F(k) * [2*F(k+1) - F(k)]
     F(2k+1) = F(k)^2 + F(k+1)^2
 
+    The bits of n are walked from most to least significant, keeping
+    (F(k), F(k+1)) where k is the prefix of n read so far. With gmpy2
+    installed the products run on GMP integers, which switch to
+    Toom-Cook/FFT multiplication for the multi-thousand-digit values
+    that large n produce. For n <= 92 the value is read from the
+    precomputed table of every 64-bit Fibonacci number.
+
     Args:
         n: The index of the Fibonacci number.
 
     Returns:
         The nth Fibonacci number.
     """
+    if n < 0:
+        return n
+    if n <= FIB_INT64_LIMIT:
+        return _FIB_TABLE[n]
 
-    def fib_pair(k: int) -> Tuple[int, int]:
-        """Return (F(k), F(k+1))."""
-        if k == 0:
-            return (0, 1)
-
-        a, b = fib_pair(k // 2)
+    a, b = mpz(0), mpz(1)
+    for bit in bin(n)[2:]:
         c = a * (2 * b - a)
         d = a * a + b * b
-
-        if k % 2 == 0:
-            return (c, d)
+        if bit == "0":
+            a, b = c, d
         else:
-            return (d, c + d)
-
-    return fib_pair(n)[0]
+            a, b = d, c + d
+    return int(a)
 
 
 def lucas_number(n: int) -> int:
@@ -247,10 +319,8 @@ def lucas_number(n: int) -> int:
     Returns:
         The nth Lucas number.
     """
-    if n == 0:
-        return 2
-    if n == 1:
-        return 1
+    if 0 <= n <= LUCAS_INT64_LIMIT:
+        return _LUCAS_TABLE[n]
 
     a, b = 2, 1
     for _ in range(2, n + 1):
@@ -273,10 +343,10 @@ def tribonacci(n: int) -> int:
     Returns:
         The nth Tribonacci number.
     """
-    if n < 2:
+    if n < 0:
         return 0
-    if n == 2:
-        return 1
+    if n <= TRIBONACCI_INT64_LIMIT:
+        return _TRIBONACCI_TABLE[n]
 
     a, b, c = 0, 0, 1
     for _ in range(3, n + 1):
@@ -284,10 +354,17 @@ def tribonacci(n: int) -> int:
     return c
 
 
+def _is_perfect_square(x: int) -> bool:
+    """Check exactly whether a non-negative int is a perfect square."""
+    root = math.isqrt(x)
+    return root * root == x
+
+
 def is_fibonacci(n: int) -> bool:
     """Check if a number is a Fibonacci number.
 
     A number is Fibonacci if one of 5n^2 + 4 or 5n^2 - 4 is a perfect square.
+    Values up to F(92) are looked up in a precomputed set instead.
 
     Args:
         n: The number to check.
@@ -297,19 +374,134 @@ def is_fibonacci(n: int) -> bool:
     """
     if n < 0:
         return False
+    if n <= _FIB_TABLE[-1]:
+        return n in _FIB_SET
+
+    # n > F(92) here, so 5n^2 - 4 is positive
+    q = 5 * n * n
+    return _is_perfect_square(q + 4) or _is_perfect_square(q - 4)
+
 
-    def is_perfect_square(x: int) -> bool:
-        if x < 0:
+# The first 13 primes. As Miller-Rabin witnesses they decide primality
+# exactly for every n below _MR_DETERMINISTIC_LIMIT.
+_MR_WITNESSES: Tuple[int, ...] = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_MR_DETERMINISTIC_LIMIT = 3_317_044_064_679_887_385_961_981
+
+# Primes below 100, tried as divisors before running Miller-Rabin
+_SMALL_PRIMES: Tuple[int, ...] = tuple(
+    p for p in range(2, 100) if all(p % q for q in range(2, math.isqrt(p) + 1))
+)
+
+
+def _miller_rabin(n: int, witnesses: Tuple[int, ...]) -> bool:
+    """Run Miller-Rabin on an odd n > 2 with the given witnesses.
+
+    Args:
+        n: Odd number to test.
+        witnesses: Bases to test against, each smaller than n.
+
+    Returns:
+        False if some witness proves n composite, True otherwise.
+    """
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in witnesses:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
             return False
-        sqrt = int(math.sqrt(x))
-        return sqrt * sqrt == x
+    return True
+
+
+def _jacobi(a: int, n: int) -> int:
+    """Return the Jacobi symbol (a/n) for odd n > 0."""
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _strong_lucas(n: int) -> bool:
+    """Run the strong Lucas probable prime test on an odd n > 2.
 
-    return is_perfect_square(5 * n * n + 4) or is_perfect_square(5 * n * n - 4)
+    Uses Selfridge's parameters: the first D in 5, -7, 9, -11, ... with
+    (D/n) = -1, then P = 1 and Q = (1 - D) / 4.
 
+    Args:
+        n: Odd number to test, with no prime factor below 100.
 
+    Returns:
+        False if n is proven composite, True if it is a strong Lucas
+        probable prime.
+    """
+    if _is_perfect_square(n):
+        return False
+    disc = 5
+    while True:
+        j = _jacobi(disc, n)
+        if j == -1:
+            break
+        if j == 0:
+            return False
+        disc = -disc - 2 if disc > 0 else -disc + 2
+    q = (1 - disc) // 4
+
+    d = n + 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    def half(x: int) -> int:
+        """Return x / 2 mod n."""
+        return (x + n if x % 2 else x) // 2 % n
+
+    # Walk the bits of d from U(1) = 1, V(1) = P = 1, Q^1
+    u, v, qk = 1, 1, q % n
+    for bit in bin(d)[3:]:
+        u, v, qk = u * v % n, (v * v - 2 * qk) % n, qk * qk % n
+        if bit == "1":
+            u, v, qk = half(u + v), half(disc * u + v), qk * q % n
+
+    if u == 0 or v == 0:
+        return True
+    for _ in range(s - 1):
+        v, qk = (v * v - 2 * qk) % n, qk * qk % n
+        if v == 0:
+            return True
+    return False
+
+
+@lru_cache(maxsize=4096)
 def is_prime(n: int) -> bool:
     """Check if a number is prime.
 
+    Small factors are rejected by trial division with the primes below
+    100, which also settles every n < 100^2. Larger n go through
+    Miller-Rabin with the first 13 primes as witnesses, which is exact
+    for n < 3.3 * 10^24. Above that n gets the Baillie-PSW test (a base-2
+    strong probable prime test plus a strong Lucas test), which has no
+    known counterexample; gmpy2 runs it when installed. When the C
+    extension is built, every n < 2^64 is tested there with 64-bit
+    arithmetic instead.
+
     Args:
         n: The number to check.
 
@@ -318,14 +510,23 @@ def is_prime(n: int) -> bool:
     """
     if n < 2:
         return False
-    if n == 2:
+    if _golden_ratio_c is not None and n < 1 << 64:
+        try:
+            index = operator.index(n)  # accepts int-like types such as np.int64
+        except TypeError:  # e.g. floats, which the Python test below handles
+            pass
+        else:
+            return bool(_golden_ratio_c.is_prime(index))
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < 100 * 100:
         return True
-    if n % 2 == 0:
-        return False
-    for i in range(3, int(n**0.5) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
+    if n < _MR_DETERMINISTIC_LIMIT:
+        return _miller_rabin(n, _MR_WITNESSES)
+    if _gmpy2_is_bpsw_prp is not None:
+        return bool(_gmpy2_is_bpsw_prp(n))
+    return _miller_rabin(n, (2,)) and _strong_lucas(n)
 
 
 def fibonacci_primes(max_index: int) -> List[Tuple[int, int]]:
@@ -337,11 +538,13 @@ def fibonacci_primes(max_index: int) -> List[Tuple[int, int]]:
     Returns:
         List of (index, Fibonacci prime) tuples.
     """
+    # One sweep of the recurrence: a = F(i), b = F(i+1)
     primes = []
-    for i in range(2, max_index + 1):
-        f = fib_iterative(i)
-        if is_prime(f):
-            primes.append((i, f))
+    a, b = 1, 1
+    for i in range(1, max_index + 1):
+        if is_prime(a):
+            primes.append((i, a))
+        a, b = b, a + b
     return primes
 
 
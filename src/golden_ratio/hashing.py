@@ -8,8 +8,32 @@ making it useful for hash tables and quasi-random number generation.
 import math
 from typing import List
 
+import numpy as np
+
 from golden_ratio.constants import INV_PHI
 
+# 2^64 / phi rounded to an odd integer (Knuth's multiplicative constant);
+# 32-bit tables would use 2^32 / phi = 2654435769 instead
+FIB_MULT = 11400714819323198485
+MASK64 = (1 << 64) - 1
+
+
+def _generalized_phi(d: int) -> float:
+    """Calculate generalized golden ratio for dimension d."""
+    # Uses the plastic constant for higher dimensions
+    if d == 1:
+        return INV_PHI
+    elif d == 2:
+        # Plastic constant inverse
+        return 0.7548776662466927
+    else:
+        # Approximate using nth root of phi
+        return 1 / (1.0 + math.sqrt(d))
+
+
+# Per-dimension bases for the usual low dimensions, computed once at import
+_LDS_BASES = tuple(_generalized_phi(d) for d in range(1, 9))
+
 
 class GoldenHash:
     """Golden ratio based hashing utilities."""
@@ -22,7 +46,11 @@ class GoldenHash:
         which often cause clustering with simpler hash functions.
 
         The technique multiplies the key by the inverse of phi,
-        takes the fractional part, and scales to the table size.
+        takes the fractional part, and scales to the table size. The
+        fraction is kept as a 64-bit integer (key * 2^64/phi mod 2^64), so
+        the whole computation is integer arithmetic: the hash is the top
+        64 bits of fraction * table_size. For power-of-two tables this
+        equals fibonacci_hash.
 
         Args:
             key: The key to hash.
@@ -36,8 +64,7 @@ class GoldenHash:
             >>> GoldenHash.hash(2, 100)  # 23
             >>> # Sequential keys are well-distributed
         """
-        fractional = (key * INV_PHI) % 1
-        return int(table_size * fractional)
+        return (((key * FIB_MULT) & MASK64) * table_size) >> 64
 
     @staticmethod
     def weyl_sequence(n: int, seed: float = 0.5) -> List[float]:
@@ -57,12 +84,9 @@ class GoldenHash:
             >>> values = GoldenHash.weyl_sequence(10)
             >>> # Values are evenly distributed across [0, 1)
         """
-        sequence = []
-        state = seed
-        for _ in range(n):
-            state = (state + INV_PHI) % 1
-            sequence.append(round(state, 6))
-        return sequence
+        # The k-th state is (seed + k * INV_PHI) mod 1, so no running sum is needed
+        i = np.arange(1, n + 1, dtype=np.float64)
+        return [round(value, 6) for value in ((seed + i * INV_PHI) % 1.0).tolist()]
 
     @staticmethod
     def low_discrepancy_sequence(n: int, dimensions: int = 1) -> List[List[float]]:
@@ -79,29 +103,12 @@ class GoldenHash:
             List of points, each point is a list of coordinates.
         """
         # Generalized golden ratio for each dimension
-        def generalized_phi(d: int) -> float:
-            """Calculate generalized golden ratio for dimension d."""
-            # Uses the plastic constant for higher dimensions
-            if d == 1:
-                return INV_PHI
-            elif d == 2:
-                # Plastic constant inverse
-                return 0.7548776662466927
-            else:
-                # Approximate using nth root of phi
-                return 1 / (1.0 + math.sqrt(d))
-
-        points = []
-        bases = [generalized_phi(d + 1) for d in range(dimensions)]
-
-        for i in range(n):
-            point = []
-            for d in range(dimensions):
-                value = (0.5 + (i + 1) * bases[d]) % 1
-                point.append(round(value, 6))
-            points.append(point)
-
-        return points
+        bases = list(_LDS_BASES[: max(dimensions, 0)])
+        bases.extend(_generalized_phi(d + 1) for d in range(len(bases), dimensions))
+
+        i = np.arange(1, n + 1, dtype=np.float64)[:, None]
+        values = (0.5 + i * np.array(bases, dtype=np.float64)) % 1.0
+        return [[round(value, 6) for value in point] for point in values.tolist()]
 
     @staticmethod
     def fibonacci_hash(key: int, table_size: int) -> int:
@@ -116,14 +123,14 @@ class GoldenHash:
 
         Returns:
             Hash value in range [0, table_size).
-        """
-        # For 64-bit: 2^64 * (phi - 1) ≈ 11400714819323198485
-        # For 32-bit: 2^32 * (phi - 1) ≈ 2654435769
-        fib_mult = 11400714819323198485
 
-        # Determine the number of bits needed for table_size
-        bits = table_size.bit_length()
+        Note:
+            A table of 2^k slots is indexed by the top k bits of the
+            product.
+        """
+        # A table of 2^bits slots is indexed by the top `bits` bits
+        bits = table_size.bit_length() - 1
 
         # Multiply and extract top bits
-        product = (key * fib_mult) & ((1 << 64) - 1)
+        product = (key * FIB_MULT) & MASK64
         return product >> (64 - bits)
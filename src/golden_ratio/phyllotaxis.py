@@ -5,11 +5,50 @@ Generate natural patterns based on the golden angle, including
 sunflower seed arrangements and golden spirals.
 """
 
+import importlib.util
 import math
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Callable, List, Tuple
+
+import numpy as np
 
 from golden_ratio.constants import GOLDEN_ANGLE, PHI
 
+# Numba is an optional accelerator (the "fast" extra); it is only imported
+# when the sunflower kernel is first needed
+HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
+# Below this many points the NumPy path is as fast as the JIT kernel
+NUMBA_MIN_POINTS = 10_000
+
+# Angles i * GOLDEN_ANGLE are reduced modulo one turn before cos/sin, so the
+# trig functions always see a bounded argument however large i gets
+TWO_PI = 2 * math.pi
+
+
+@lru_cache(maxsize=None)
+def _sunflower_kernel() -> Callable[[int, float, float, np.ndarray], None]:
+    """Compile the parallel sunflower kernel, importing Numba on the first call."""
+    from numba import njit, prange  # type: ignore[import-not-found]
+
+    @njit(parallel=True, cache=True)  # type: ignore[misc]
+    def kernel(n: int, c: float, golden_angle: float, out: np.ndarray) -> None:
+        """Write the Vogel-model sunflower points into an (n, 2) buffer."""
+        for i in prange(n):
+            r = c * math.sqrt(i)
+            theta = (i * golden_angle) % TWO_PI
+            out[i, 0] = r * math.cos(theta)
+            out[i, 1] = r * math.sin(theta)
+
+    return kernel  # type: ignore[no-any-return]
+
+
+def _to_tuples(points: np.ndarray) -> List[Tuple[float, float]]:
+    """Round an (n, 2) point array to 4 places and convert it to (x, y) tuples."""
+    # Builtin round, as the scalar loops used; np.round scales by 10**4
+    # first and can land on the other side of a tie for large coordinates
+    return [(round(x, 4), round(y, 4)) for x, y in points.tolist()]
+
 
 class Phyllotaxis:
     """Phyllotaxis (plant growth pattern) generation."""
@@ -32,14 +71,37 @@ class Phyllotaxis:
             >>> points = Phyllotaxis.sunflower_pattern(100)
             >>> # Plot points to see the sunflower pattern
         """
-        points = []
-        for i in range(n_points):
-            r = c * math.sqrt(i)
-            theta = i * GOLDEN_ANGLE
-            x = r * math.cos(theta)
-            y = r * math.sin(theta)
-            points.append((round(x, 4), round(y, 4)))
-        return points
+        return _to_tuples(Phyllotaxis.sunflower_pattern_array(n_points, c))
+
+    @staticmethod
+    def sunflower_pattern_array(n_points: int, c: float = 2.0) -> np.ndarray:
+        """Generate sunflower seed pattern points as an array.
+
+        Same points as sunflower_pattern, unrounded and kept in one float64
+        buffer; plotting libraries such as matplotlib accept it directly.
+
+        With Numba installed, n_points >= NUMBA_MIN_POINTS are computed by a
+        parallel JIT kernel in one pass, without the NumPy temporaries. The
+        kernel is compiled without fastmath, so it follows the same IEEE
+        operations as the NumPy path; only its sin and cos can come from a
+        different math library and differ in the last bit.
+
+        Args:
+            n_points: Number of points to generate.
+            c: Scaling constant controlling spacing.
+
+        Returns:
+            Array of shape (n, 2) holding x and y columns.
+        """
+        if HAVE_NUMBA and n_points >= NUMBA_MIN_POINTS:
+            out = np.empty((n_points, 2), dtype=np.float64)
+            _sunflower_kernel()(n_points, float(c), GOLDEN_ANGLE, out)
+            return out
+
+        i = np.arange(n_points, dtype=np.float64)
+        r = c * np.sqrt(i)
+        theta = np.mod(i * GOLDEN_ANGLE, TWO_PI)
+        return np.column_stack((r * np.cos(theta), r * np.sin(theta)))
 
     @staticmethod
     def golden_spiral_points(
@@ -57,14 +119,30 @@ class Phyllotaxis:
         Returns:
             List of (x, y) coordinate tuples.
         """
-        points = []
-        for i in range(n_points):
-            angle = i * 0.1
-            r = growth ** (angle / (2 * math.pi))
-            x = r * math.cos(angle)
-            y = r * math.sin(angle)
-            points.append((round(x, 4), round(y, 4)))
-        return points
+        return _to_tuples(Phyllotaxis.golden_spiral_array(n_points, growth))
+
+    @staticmethod
+    def golden_spiral_array(n_points: int = 100, growth: float = PHI) -> np.ndarray:
+        """Generate points along a golden spiral as an array.
+
+        Same points as golden_spiral_points, unrounded.
+
+        Args:
+            n_points: Number of points to generate.
+            growth: Growth factor per full rotation (default phi).
+
+        Returns:
+            Array of shape (n, 2) holding x and y columns.
+        """
+        angle = np.arange(n_points, dtype=np.float64) * 0.1
+        # r is raised with the builtin pow: NumPy's SIMD power can differ in the
+        # last bit, which the 4-place rounding exposes once r reaches ~1e9
+        r = np.fromiter(
+            (growth ** e for e in (angle / (2 * math.pi)).tolist()),
+            dtype=np.float64,
+            count=n_points,
+        )
+        return np.column_stack((r * np.cos(angle), r * np.sin(angle)))
 
     @staticmethod
     def fermat_spiral(n_points: int, scale: float = 1.0) -> List[Tuple[float, float]]:
@@ -80,14 +158,26 @@ class Phyllotaxis:
         Returns:
             List of (x, y) coordinate tuples.
         """
-        points = []
-        for i in range(n_points):
-            theta = i * GOLDEN_ANGLE
-            r = scale * math.sqrt(theta)
-            x = r * math.cos(theta)
-            y = r * math.sin(theta)
-            points.append((round(x, 4), round(y, 4)))
-        return points
+        return _to_tuples(Phyllotaxis.fermat_spiral_array(n_points, scale))
+
+    @staticmethod
+    def fermat_spiral_array(n_points: int, scale: float = 1.0) -> np.ndarray:
+        """Generate a Fermat spiral pattern as an array.
+
+        Same points as fermat_spiral, unrounded.
+
+        Args:
+            n_points: Number of points.
+            scale: Scale factor.
+
+        Returns:
+            Array of shape (n, 2) holding x and y columns.
+        """
+        # r uses the full angle; only the trig argument is reduced
+        theta = np.arange(n_points, dtype=np.float64) * GOLDEN_ANGLE
+        r = scale * np.sqrt(theta)
+        theta = np.mod(theta, TWO_PI)
+        return np.column_stack((r * np.cos(theta), r * np.sin(theta)))
 
     @staticmethod
     def daisy_pattern(n_florets: int, inner_radius: float = 1.0) -> List[Tuple[float, float]]:
@@ -103,11 +193,22 @@ class Phyllotaxis:
         Returns:
             List of (x, y) coordinate tuples.
         """
-        points = []
-        for i in range(1, n_florets + 1):
-            theta = i * GOLDEN_ANGLE
-            r = inner_radius * math.sqrt(i)
-            x = r * math.cos(theta)
-            y = r * math.sin(theta)
-            points.append((round(x, 4), round(y, 4)))
-        return points
+        return _to_tuples(Phyllotaxis.daisy_pattern_array(n_florets, inner_radius))
+
+    @staticmethod
+    def daisy_pattern_array(n_florets: int, inner_radius: float = 1.0) -> np.ndarray:
+        """Generate a daisy-like flower pattern as an array.
+
+        Same points as daisy_pattern, unrounded.
+
+        Args:
+            n_florets: Number of florets to generate.
+            inner_radius: Radius of the innermost floret.
+
+        Returns:
+            Array of shape (n, 2) holding x and y columns.
+        """
+        i = np.arange(1, n_florets + 1, dtype=np.float64)
+        theta = np.mod(i * GOLDEN_ANGLE, TWO_PI)
+        r = inner_radius * np.sqrt(i)
+        return np.column_stack((r * np.cos(theta), r * np.sin(theta)))
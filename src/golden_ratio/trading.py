@@ -5,14 +5,55 @@ Provides tools for calculating Fibonacci retracement and extension levels
 commonly used in technical analysis of financial markets.
 """
 
-from typing import Dict, List
+from typing import Dict, NamedTuple, Sequence, Tuple, Union
+
+import numpy as np
+
+
+class Retracement(NamedTuple):
+    """Retracement prices, one field per level in RETRACEMENT_LEVELS."""
+
+    r0: float
+    r236: float
+    r382: float
+    r500: float
+    r618: float
+    r786: float
+    r1000: float
+
+
+def _readonly(levels: Sequence[float]) -> np.ndarray:
+    """Return levels as a float64 array that cannot be modified in place."""
+    array = np.array(levels, dtype=np.float64)
+    array.setflags(write=False)
+    return array
 
 
 class FibonacciTrading:
     """Fibonacci trading calculations for technical analysis."""
 
-    RETRACEMENT_LEVELS: List[float] = [0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0]
-    EXTENSION_LEVELS: List[float] = [1.272, 1.618, 2.0, 2.618, 4.236]
+    # Tuples, because the array forms and keys below are built from them once
+    RETRACEMENT_LEVELS: Tuple[float, ...] = (0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0)
+    EXTENSION_LEVELS: Tuple[float, ...] = (1.272, 1.618, 2.0, 2.618, 4.236)
+    _GOLDEN_POCKET_LEVELS: Tuple[float, ...] = (0.618, 0.65)
+
+    # Array forms of the levels and their formatted dict keys, built once and
+    # shared read-only by every call
+    _RETRACEMENT_ARRAY: np.ndarray = _readonly(RETRACEMENT_LEVELS)
+    _EXTENSION_ARRAY: np.ndarray = _readonly(EXTENSION_LEVELS)
+    _GOLDEN_POCKET_ARRAY: np.ndarray = _readonly(_GOLDEN_POCKET_LEVELS)
+    # Retracement offset direction indexed by is_uptrend: down from the high in
+    # an uptrend, up from the low in a downtrend
+    _TREND_SIGN: np.ndarray = _readonly([1.0, -1.0])
+    _RETRACEMENT_KEYS: Tuple[str, ...] = tuple(
+        f"{level * 100:.1f}%" for level in RETRACEMENT_LEVELS
+    )
+    _EXTENSION_KEYS: Tuple[str, ...] = tuple(f"{level * 100:.1f}%" for level in EXTENSION_LEVELS)
+    # Retracement, extension and golden pocket ratios side by side, so that
+    # all_levels computes every offset in one pass
+    _ALL_LEVELS_ARRAY: np.ndarray = _readonly(
+        RETRACEMENT_LEVELS + EXTENSION_LEVELS + _GOLDEN_POCKET_LEVELS
+    )
 
     @staticmethod
     def retracements(high: float, low: float, is_uptrend: bool = True) -> Dict[str, float]:
@@ -35,15 +76,65 @@ class FibonacciTrading:
             >>> print(levels['61.8%'])  # 138.2 (key support level)
         """
         diff = high - low
-        levels = {}
+        offsets = diff * FibonacciTrading._RETRACEMENT_ARRAY
+        prices = high - offsets if is_uptrend else low + offsets
+        return dict(zip(FibonacciTrading._RETRACEMENT_KEYS, [round(p, 4) for p in prices.tolist()]))
+
+    @staticmethod
+    def retracements_tuple(high: float, low: float, is_uptrend: bool = True) -> Retracement:
+        """Calculate Fibonacci retracement levels as a named tuple.
+
+        Same prices as retracements, without building a dict and string
+        keys per call, for callers that compute many levels.
+
+        Args:
+            high: Swing high price.
+            low: Swing low price.
+            is_uptrend: True for uptrend, False for downtrend.
+
+        Returns:
+            Retracement with fields r0 through r1000.
+
+        Example:
+            >>> FibonacciTrading.retracements_tuple(200, 100).r618  # 138.2
+        """
+        diff = high - low
+        offsets = diff * FibonacciTrading._RETRACEMENT_ARRAY
+        prices = high - offsets if is_uptrend else low + offsets
+        return Retracement._make([round(p, 4) for p in prices.tolist()])
 
-        for level in FibonacciTrading.RETRACEMENT_LEVELS:
-            if is_uptrend:
-                price = high - (diff * level)
-            else:
-                price = low + (diff * level)
-            levels[f"{level * 100:.1f}%"] = round(price, 4)
+    @staticmethod
+    def retracements_batch(
+        highs: np.ndarray, lows: np.ndarray, is_uptrend: Union[bool, np.ndarray] = True
+    ) -> np.ndarray:
+        """Calculate retracement levels for a whole series of swings.
 
+        Args:
+            highs: Swing high prices, shape (n,).
+            lows: Swing low prices, shape (n,).
+            is_uptrend: One trend direction for every swing, or a boolean
+                array of shape (n,) giving it per swing.
+
+        Returns:
+            Unrounded prices of shape (n, 7); column j is the level
+            RETRACEMENT_LEVELS[j].
+        """
+        high = np.asarray(highs, dtype=np.float64)[:, None]
+        low = np.asarray(lows, dtype=np.float64)[:, None]
+        offsets = (high - low) * FibonacciTrading._RETRACEMENT_ARRAY
+        uptrend = np.asarray(is_uptrend, dtype=bool)
+        levels: np.ndarray
+        if uptrend.ndim:
+            # Mixed trends: signed offsets from each row's anchor, without
+            # computing both directions for every row
+            uptrend = uptrend[:, None]
+            offsets *= FibonacciTrading._TREND_SIGN[uptrend.astype(np.intp)]
+            offsets += np.where(uptrend, high, low)
+            levels = offsets
+        elif uptrend:
+            levels = high - offsets
+        else:
+            levels = low + offsets
         return levels
 
     @staticmethod
@@ -66,16 +157,9 @@ class FibonacciTrading:
             >>> print(levels['161.8%'])  # 261.8 (common target)
         """
         diff = high - low
-        levels = {}
-
-        for level in FibonacciTrading.EXTENSION_LEVELS:
-            if is_uptrend:
-                price = low + (diff * level)
-            else:
-                price = high - (diff * level)
-            levels[f"{level * 100:.1f}%"] = round(price, 4)
-
-        return levels
+        offsets = diff * FibonacciTrading._EXTENSION_ARRAY
+        prices = low + offsets if is_uptrend else high - offsets
+        return dict(zip(FibonacciTrading._EXTENSION_KEYS, [round(p, 4) for p in prices.tolist()]))
 
     @staticmethod
     def golden_pocket(high: float, low: float, is_uptrend: bool = True) -> Dict[str, float]:
@@ -92,14 +176,12 @@ class FibonacciTrading:
         Returns:
             Dictionary with upper, lower, and midpoint of golden pocket.
         """
-        diff = high - low
+        offsets = (high - low) * FibonacciTrading._GOLDEN_POCKET_ARRAY
 
         if is_uptrend:
-            upper = high - (diff * 0.618)
-            lower = high - (diff * 0.65)
+            upper, lower = (high - offsets).tolist()
         else:
-            lower = low + (diff * 0.618)
-            upper = low + (diff * 0.65)
+            lower, upper = (low + offsets).tolist()
 
         return {
             "upper": round(upper, 4),
@@ -111,6 +193,9 @@ class FibonacciTrading:
     def all_levels(high: float, low: float, is_uptrend: bool = True) -> Dict[str, Dict[str, float]]:
         """Calculate all Fibonacci levels at once.
 
+        Gives the same prices as calling retracements, extensions, and
+        golden_pocket, from a single pass over all of their ratios.
+
         Args:
             high: Swing high price.
             low: Swing low price.
@@ -119,8 +204,31 @@ class FibonacciTrading:
         Returns:
             Dictionary containing retracements, extensions, and golden pocket.
         """
+        offsets = (high - low) * FibonacciTrading._ALL_LEVELS_ARRAY
+        below_high = (high - offsets).tolist()
+        above_low = (low + offsets).tolist()
+
+        # Retracements and the golden pocket are measured from the high in an
+        # uptrend (from the low in a downtrend), extensions from the other end
+        n_retr = len(FibonacciTrading.RETRACEMENT_LEVELS)
+        pocket = n_retr + len(FibonacciTrading.EXTENSION_LEVELS)
+        if is_uptrend:
+            retracements, extensions = below_high[:n_retr], above_low[n_retr:pocket]
+            upper, lower = below_high[pocket:]
+        else:
+            retracements, extensions = above_low[:n_retr], below_high[n_retr:pocket]
+            lower, upper = above_low[pocket:]
+
         return {
-            "retracements": FibonacciTrading.retracements(high, low, is_uptrend),
-            "extensions": FibonacciTrading.extensions(high, low, is_uptrend),
-            "golden_pocket": FibonacciTrading.golden_pocket(high, low, is_uptrend),
+            "retracements": dict(
+                zip(FibonacciTrading._RETRACEMENT_KEYS, [round(p, 4) for p in retracements])
+            ),
+            "extensions": dict(
+                zip(FibonacciTrading._EXTENSION_KEYS, [round(p, 4) for p in extensions])
+            ),
+            "golden_pocket": {
+                "upper": round(upper, 4),
+                "lower": round(lower, 4),
+                "midpoint": round((upper + lower) / 2, 4),
+            },
         }
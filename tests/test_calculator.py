@@ -0,0 +1,71 @@
+"""Tests for the standalone calculator script in code/python."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "code" / "python" / "calculator.py"
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    """Load calculator.py as a module without running its demo."""
+    spec = importlib.util.spec_from_file_location("calculator", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestSubdivideSoa:
+    """Test GoldenRectangle.subdivide_soa."""
+
+    @pytest.mark.parametrize("width, height", [(1618.033988749895, 1000), (300, 200)])
+    def test_negative_n_returns_no_squares(self, calculator, width, height):
+        """Test that n <= 0 gives empty arrays on both the golden and general paths."""
+        for n in (0, -1, -5):
+            sides, iterations = calculator.GoldenRectangle.subdivide_soa(width, height, n)
+            assert len(sides) == 0
+            assert len(iterations) == 0
+            assert calculator.GoldenRectangle.subdivide(width, height, n) == []
+
+
+class TestWeylSequence:
+    """Test GoldenHash.weyl_sequence."""
+
+    @staticmethod
+    def _float_loop(n, seed):
+        """Advance the sequence with float arithmetic, as the original loop did."""
+        sequence = []
+        state = seed
+        for _ in range(n):
+            state = (state + 0.6180339887498949) % 1
+            sequence.append(state)
+        return sequence
+
+    @pytest.mark.parametrize("seed", [0.5, 0.0, 0.25, 1, 0, 3])
+    def test_seed_is_a_fraction(self, calculator, seed):
+        """Test float and int seeds both start from the fraction seed mod 1."""
+        values = calculator.GoldenHash.weyl_sequence(50, seed)
+        assert values == pytest.approx(self._float_loop(50, seed), abs=1e-12)
+        assert all(0 <= v < 1 for v in values)
+
+    def test_int_seed_matches_float_seed(self, calculator):
+        """Test seed=1 means 1.0, not the raw state 1."""
+        gh = calculator.GoldenHash
+        assert gh.weyl_sequence(20, 1) == gh.weyl_sequence(20, 1.0)
+
+    def test_numpy_seed(self, calculator):
+        """Test NumPy scalars are accepted as seeds."""
+        np = pytest.importorskip("numpy")
+        expected = calculator.GoldenHash.weyl_sequence(20, 0.25)
+        assert calculator.GoldenHash.weyl_sequence(20, np.float32(0.25)) == expected
+        assert calculator.GoldenHash.weyl_sequence(20, np.float64(0.25)) == expected
+
+    def test_raw_state(self, calculator):
+        """Test state= resumes a sequence from its raw 64-bit state."""
+        gh = calculator.GoldenHash
+        full = gh.weyl_sequence(10, 0.5)
+        state = (int(0.5 * (1 << 64)) + 4 * gh.FIB_MULT) & gh.MASK64
+        assert gh.weyl_sequence(6, state=state) == full[4:]
+        assert gh.weyl_sequence(3, state=0) == gh.weyl_sequence(3, 0.0)
@@ -3,7 +3,18 @@
 import math
 import pytest
 
-from golden_ratio.constants import PHI, PSI, GOLDEN_ANGLE, GOLDEN_ANGLE_DEGREES, INV_PHI
+from golden_ratio.constants import (
+    PHI,
+    PSI,
+    GOLDEN_ANGLE,
+    GOLDEN_ANGLE_DEGREES,
+    INV_PHI,
+    INV_SQRT5,
+    PHI_SQ,
+    SQRT5,
+    PHI_POWERS,
+    INV_PHI_POWERS,
+)
 
 
 class TestConstants:
@@ -47,3 +58,16 @@ class TestConstants:
     def test_inv_phi(self):
         """Test inverse phi equals 1/PHI."""
         assert abs(INV_PHI - 1 / PHI) < 1e-10
+
+    def test_sqrt5_constants(self):
+        """Test the Binet constants and phi squared."""
+        assert math.sqrt(5) == SQRT5
+        assert abs(INV_SQRT5 - 1 / math.sqrt(5)) < 1e-15
+        assert abs(PHI_SQ - (PHI + 1)) < 1e-15
+
+    def test_phi_powers_table(self):
+        """Test the precomputed power tables match phi^i and phi^-i."""
+        assert len(PHI_POWERS) == len(INV_PHI_POWERS) == 64
+        for i, (p, q) in enumerate(zip(PHI_POWERS, INV_PHI_POWERS)):
+            assert p == pytest.approx(PHI**i, rel=1e-15)
+            assert q == pytest.approx(PHI**-i, rel=1e-15)
@@ -1,9 +1,11 @@
 """Tests for core golden ratio functions."""
 
+import json
+
 import pytest
 
 from golden_ratio.constants import PHI
-from golden_ratio.core import GoldenRatio, GoldenRectangle
+from golden_ratio.core import GoldenRatio, GoldenRectangle, RectangleResult
 
 
 class TestGoldenRatio:
@@ -65,6 +67,20 @@ class TestGoldenRectangle:
         assert abs(result["width"] - 1618) < 1
         assert result["ratio"] == PHI
 
+    def test_from_width_is_dict(self):
+        """Test the dict result supports membership, key iteration and JSON."""
+        result = GoldenRectangle.from_width(10)
+        assert "width" in result
+        assert list(result) == ["width", "height", "area", "ratio"]
+        assert json.loads(json.dumps(result)) == result
+
+    def test_tuple_constructors(self):
+        """Test the named tuple forms match the dict results."""
+        result = GoldenRectangle.from_width_tuple(100)
+        assert isinstance(result, RectangleResult)
+        assert result._asdict() == GoldenRectangle.from_width(100)
+        assert GoldenRectangle.from_height_tuple(100)._asdict() == GoldenRectangle.from_height(100)
+
     def test_area_calculation(self):
         """Test area is correctly calculated."""
         result = GoldenRectangle.from_width(100)
@@ -88,3 +104,21 @@ class TestGoldenRectangle:
         subdivisions = GoldenRectangle.subdivide(100, 61.8, 3)
         for i, sub in enumerate(subdivisions):
             assert sub["iteration"] == i
+
+    def test_subdivide_arrays(self):
+        """Test array subdivision matches the dict version."""
+        sides = GoldenRectangle.subdivide_arrays(1618, 1000, 8)
+        subdivisions = GoldenRectangle.subdivide(1618, 1000, 8)
+        assert sides.shape == (8,)
+        assert sides.tolist() == [sub["side"] for sub in subdivisions]
+
+    def test_subdivide_golden_closed_form(self):
+        """Test that a golden rectangle gives sides shrinking by phi."""
+        sides = GoldenRectangle.subdivide_arrays(100 * PHI, 100, 80)
+        for k in (0, 1, 10, 79):
+            assert sides[k] == pytest.approx(100 / PHI**k, rel=1e-12)
+
+    def test_subdivide_long_run(self):
+        """Test a rectangle many squares long."""
+        sides = GoldenRectangle.subdivide_arrays(10, 1, 12)
+        assert sides.tolist() == [1.0] * 10 + [0.0] * 2
@@ -101,3 +101,41 @@ class TestDesignScale:
         positive = [k for k in scale.keys() if k > 0]
         negative = [k for k in scale.keys() if k < 0]
         assert len(positive) == len(negative)
+
+    def test_modular_scale_matches_power(self):
+        """Test PHI scales match base * PHI**i inside and beyond the power table."""
+        for steps in (5, 70):
+            scale = DesignScale.modular_scale(16, PHI, steps=steps)
+            for i in (-steps, -1, 1, steps):
+                assert scale[i] == round(16 * PHI**i, 2)
+
+    def test_modular_scale_rounds_like_round(self):
+        """Test values round half-way cases like builtin round for other bases."""
+        assert DesignScale.modular_scale(61.775, 1.5)[0] == 61.77
+        for base in (10, 13.7, 61.775, 99.5):
+            scale = DesignScale.modular_scale(base, PHI, steps=8)
+            assert scale == {i: round(base * PHI**i, 2) for i in range(-8, 9)}
+
+    def test_modular_scale_zero_ratio(self):
+        """Test a zero ratio raises for negative steps, as ratio**i does."""
+        with pytest.raises(ZeroDivisionError):
+            DesignScale.modular_scale(16, 0, steps=2)
+        assert DesignScale.modular_scale(16, 0, steps=0) == {0: 16.0}
+
+    def test_modular_scale_overflow(self):
+        """Test powers too large for a float raise instead of returning inf."""
+        with pytest.raises(OverflowError):
+            DesignScale.modular_scale(16, 1e200, steps=3)
+        with pytest.raises(OverflowError):
+            DesignScale.modular_scale(16, 1e-200, steps=3)
+        with pytest.raises(OverflowError):
+            DesignScale.modular_scale(16, PHI, steps=1500)
+
+    def test_modular_scale_non_finite_ratio(self):
+        """Test infinite ratios follow float powers rather than raising."""
+        scale = DesignScale.modular_scale(16, float("inf"), steps=1)
+        assert scale == {-1: 0.0, 0: 16.0, 1: float("inf")}
+
+    def test_modular_scale_large_product(self):
+        """Test a finite power times a large base gives inf, like float arithmetic."""
+        assert DesignScale.modular_scale(1e300, 1e10, steps=1)[1] == float("inf")
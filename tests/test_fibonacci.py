@@ -56,6 +56,14 @@ class TestFibonacciClass:
         last_ratio = convergence[-1][1]
         assert abs(last_ratio - PHI) < 1e-8
 
+    def test_ratio_convergence_arrays(self):
+        """Test the array form matches the list of tuples."""
+        indices, ratios, errors = Fibonacci.ratio_convergence_arrays(20)
+        convergence = Fibonacci.ratio_convergence(20)
+        assert indices.tolist() == [c[0] for c in convergence]
+        assert [round(r, 10) for r in ratios.tolist()] == [c[1] for c in convergence]
+        assert errors.tolist() == [c[2] for c in convergence]
+
 
 class TestFibonacciAlgorithms:
     """Test different Fibonacci algorithms."""
@@ -110,6 +118,18 @@ class TestFibonacciAlgorithms:
         """Test fast doubling method."""
         assert fib_fast_doubling(n) == expected
 
+    def test_fib_fast_doubling_negative(self):
+        """Test negative indices are returned unchanged, like fib_matrix."""
+        for n in [-1, -5, -100]:
+            assert fib_fast_doubling(n) == fib_matrix(n) == n
+
+    def test_cli_nth_negative(self, capsys):
+        """Test the nth command reports negative indices the same way."""
+        from golden_ratio.cli import main
+
+        assert main(["nth", "-5"]) == 0
+        assert "F(-5) = -5" in capsys.readouterr().out
+
     def test_algorithms_agree(self):
         """Test that all algorithms produce same result."""
         for n in [10, 15, 20, 25, 30]:
@@ -120,6 +140,11 @@ class TestFibonacciAlgorithms:
 
             assert iterative == binet == matrix == fast
 
+    def test_fib_binet_large_n(self):
+        """Test Binet stays exact beyond float precision."""
+        for n in [70, 71, 100, 500]:
+            assert fib_binet(n) == fib_iterative(n)
+
 
 class TestLucasNumbers:
     """Test Lucas number calculations."""
@@ -135,6 +160,12 @@ class TestLucasNumbers:
         for i, exp in enumerate(expected):
             assert lucas_number(i) == exp
 
+    def test_lucas_past_table(self):
+        """Test values continue correctly past the precomputed table."""
+        for n in range(80, 100):
+            assert lucas_number(n) == lucas_number(n - 1) + lucas_number(n - 2)
+            assert lucas_number(n) == fib_iterative(n - 1) + fib_iterative(n + 1)
+
 
 class TestTribonacci:
     """Test Tribonacci calculations."""
@@ -151,6 +182,11 @@ class TestTribonacci:
         for i, exp in enumerate(expected):
             assert tribonacci(i) == exp
 
+    def test_tribonacci_past_table(self):
+        """Test values continue correctly past the precomputed table."""
+        for n in range(70, 90):
+            assert tribonacci(n) == tribonacci(n - 1) + tribonacci(n - 2) + tribonacci(n - 3)
+
 
 class TestIsFibonacci:
     """Test is_fibonacci function."""
@@ -172,6 +208,12 @@ class TestIsFibonacci:
         assert not is_fibonacci(-1)
         assert not is_fibonacci(-5)
 
+    def test_is_fibonacci_large(self):
+        """Test numbers beyond float precision."""
+        f = fib_iterative(200)
+        assert is_fibonacci(f)
+        assert not is_fibonacci(f + 1)
+
 
 class TestIsPrime:
     """Test is_prime function."""
@@ -188,6 +230,35 @@ class TestIsPrime:
         for n in non_primes:
             assert not is_prime(n), f"{n} should not be prime"
 
+    def test_large_values(self):
+        """Test large primes and strong pseudoprimes to small bases."""
+        assert is_prime(2**61 - 1)
+        assert is_prime(99194853094755497)  # F(83)
+        for n in [3215031751, 3825123056546413051, (2**61 - 1) * (2**31 - 1)]:
+            assert not is_prime(n), f"{n} should not be prime"
+
+    def test_integer_like_input(self):
+        """Test NumPy integers are accepted, including by the C extension."""
+        np = pytest.importorskip("numpy")
+        is_prime.cache_clear()
+        assert is_prime(np.int64(7919))
+        assert not is_prime(np.int64(7917))
+
+    def test_integer_like_input_c_extension(self):
+        """Test the compiled is_prime takes int-like objects directly."""
+        np = pytest.importorskip("numpy")
+        ext = pytest.importorskip("golden_ratio._golden_ratio_c")
+        assert ext.is_prime(np.int64(7919))
+        assert not ext.is_prime(np.uint64(7917))
+
+    def test_beyond_deterministic_range(self):
+        """Test Baillie-PSW above the deterministic Miller-Rabin range."""
+        assert is_prime(2**89 - 1)
+        assert is_prime(1066340417491710595814572169)  # F(131)
+        # Strong pseudoprime to every one of the first 13 prime bases
+        assert not is_prime(3317044064679887385961981)
+        assert not is_prime((2**89 - 1) * (2**61 - 1))
+
 
 class TestFibonacciPrimes:
     """Test fibonacci_primes function."""
@@ -0,0 +1,100 @@
+"""Tests for golden ratio hashing functions."""
+
+import math
+
+import pytest
+
+from golden_ratio.constants import INV_PHI
+from golden_ratio.hashing import GoldenHash
+
+
+class TestHash:
+    """Test GoldenHash.hash."""
+
+    def test_examples(self):
+        """Test the documented example values."""
+        assert GoldenHash.hash(1, 100) == 61
+        assert GoldenHash.hash(2, 100) == 23
+
+    @pytest.mark.parametrize("table_size", [1, 2, 7, 16, 100, 1000, 1024, 2**20])
+    def test_range(self, table_size):
+        """Test hashes fall in [0, table_size) for power-of-two and other sizes."""
+        for key in range(5000):
+            assert 0 <= GoldenHash.hash(key, table_size) < table_size
+
+    def test_matches_fibonacci_hash_for_powers_of_two(self):
+        """Test power-of-two tables give the same slots as fibonacci_hash."""
+        for bits in range(11):
+            for key in range(500):
+                assert GoldenHash.hash(key, 2**bits) == GoldenHash.fibonacci_hash(key, 2**bits)
+
+
+class TestFibonacciHash:
+    """Test GoldenHash.fibonacci_hash."""
+
+    @pytest.mark.parametrize("table_size", [1, 2, 16, 1024, 2**20])
+    def test_range(self, table_size):
+        """Test hashes fall in [0, table_size) for power-of-two sizes."""
+        for key in range(5000):
+            assert 0 <= GoldenHash.fibonacci_hash(key, table_size) < table_size
+
+    def test_known_values(self):
+        """Test slots come from the top log2(table_size) bits of the product."""
+        assert [GoldenHash.fibonacci_hash(k, 1024) for k in range(1, 6)] == [632, 241, 874, 483, 92]
+        assert [GoldenHash.fibonacci_hash(k, 16) for k in range(1, 6)] == [9, 3, 13, 7, 1]
+        assert GoldenHash.fibonacci_hash(12345, 2**20) == 660174
+
+    def test_range_non_power_of_two(self):
+        """Test other sizes stay below the next power of two."""
+        for table_size in (3, 100, 1000):
+            bound = 1 << (table_size.bit_length() - 1)
+            for key in range(5000):
+                assert 0 <= GoldenHash.fibonacci_hash(key, table_size) < bound
+
+    def test_sequential_keys_spread(self):
+        """Test sequential keys fill every slot of a small table."""
+        slots = {GoldenHash.fibonacci_hash(key, 64) for key in range(256)}
+        assert slots == set(range(64))
+
+
+class TestSequences:
+    """Test weyl_sequence and low_discrepancy_sequence against their scalar loops."""
+
+    @staticmethod
+    def _weyl_loop(n, seed):
+        """Build the Weyl sequence by a running sum, one value at a time."""
+        sequence = []
+        state = seed
+        for _ in range(n):
+            state = (state + INV_PHI) % 1
+            sequence.append(round(state, 6))
+        return sequence
+
+    @staticmethod
+    def _lds_loop(n, bases):
+        """Build the low-discrepancy points one coordinate at a time."""
+        return [[round((0.5 + (i + 1) * base) % 1, 6) for base in bases] for i in range(n)]
+
+    @pytest.mark.parametrize("n", [0, 1, 10, 10000])
+    @pytest.mark.parametrize("seed", [0.0, 0.5, 0.123, 1])
+    def test_weyl_sequence(self, n, seed):
+        """Test the closed form matches the running sum."""
+        assert GoldenHash.weyl_sequence(n, seed) == self._weyl_loop(n, seed)
+
+    def test_weyl_sequence_negative_n(self):
+        """Test a negative count gives an empty sequence."""
+        assert GoldenHash.weyl_sequence(-3) == []
+
+    @pytest.mark.parametrize("n", [0, 1, 10, 5000])
+    @pytest.mark.parametrize("dimensions", [0, 1, 2, 3, 6])
+    def test_low_discrepancy_sequence(self, n, dimensions):
+        """Test every coordinate matches the scalar loop."""
+        bases = [INV_PHI, 0.7548776662466927]
+        bases += [1 / (1.0 + math.sqrt(d + 1)) for d in range(2, dimensions)]
+        expected = self._lds_loop(n, bases[:dimensions])
+        assert GoldenHash.low_discrepancy_sequence(n, dimensions) == expected
+
+    def test_low_discrepancy_sequence_no_dimensions(self):
+        """Test zero or negative dimensions give empty points."""
+        assert GoldenHash.low_discrepancy_sequence(2, 0) == [[], []]
+        assert GoldenHash.low_discrepancy_sequence(2, -1) == [[], []]
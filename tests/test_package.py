@@ -0,0 +1,36 @@
+"""Tests for the golden_ratio package namespace."""
+
+import importlib
+
+import pytest
+
+import golden_ratio
+
+
+class TestPackage:
+    """Test lazy exports from the top-level package."""
+
+    @pytest.mark.parametrize(
+        "name", ["core", "design", "fibonacci", "hashing", "phyllotaxis", "trading"]
+    )
+    def test_submodule_attribute(self, name):
+        """Test submodules are reachable as attributes after import golden_ratio."""
+        assert getattr(golden_ratio, name) is importlib.import_module(f"golden_ratio.{name}")
+
+    def test_dir_lists_all_exports(self):
+        """Test dir() includes every name in __all__ before it is loaded."""
+        names = dir(golden_ratio)
+        for name in golden_ratio.__all__:
+            assert name in names
+        assert "core" in names
+
+    def test_lazy_export(self):
+        """Test exported names resolve to the objects in their submodule."""
+        from golden_ratio.fibonacci import Fibonacci
+
+        assert golden_ratio.Fibonacci is Fibonacci
+
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            golden_ratio.not_a_name
@@ -0,0 +1,77 @@
+"""Tests for phyllotaxis pattern generation."""
+
+import math
+
+import numpy as np
+import pytest
+
+from golden_ratio.constants import GOLDEN_ANGLE, PHI
+from golden_ratio.phyllotaxis import Phyllotaxis
+
+
+def _points(n, radius, angle, start=0):
+    """Build rounded (x, y) points one at a time from scalar formulas."""
+    points = []
+    for i in range(start, n + start):
+        r = radius(i)
+        theta = angle(i)
+        points.append((round(r * math.cos(theta), 4), round(r * math.sin(theta), 4)))
+    return points
+
+
+class TestPatterns:
+    """Test the vectorized patterns against the scalar formulas."""
+
+    @pytest.mark.parametrize("n,c", [(0, 2.0), (1, 2.0), (500, 2.0), (2000, 3.5)])
+    def test_sunflower_pattern(self, n, c):
+        """Test the Vogel model points."""
+        expected = _points(n, lambda i: c * math.sqrt(i), lambda i: i * GOLDEN_ANGLE)
+        assert Phyllotaxis.sunflower_pattern(n, c) == expected
+
+    @pytest.mark.parametrize("n,growth", [(0, PHI), (100, PHI), (20000, PHI), (3000, 2.0)])
+    def test_golden_spiral_points(self, n, growth):
+        """Test spiral points, including radii large enough to expose rounding."""
+        expected = _points(n, lambda i: growth ** (i * 0.1 / (2 * math.pi)), lambda i: i * 0.1)
+        assert Phyllotaxis.golden_spiral_points(n, growth) == expected
+
+    @pytest.mark.parametrize("n,scale", [(0, 1.0), (500, 1.0), (2000, 2.5)])
+    def test_fermat_spiral(self, n, scale):
+        """Test Fermat spiral points."""
+        expected = _points(
+            n, lambda i: scale * math.sqrt(i * GOLDEN_ANGLE), lambda i: i * GOLDEN_ANGLE
+        )
+        assert Phyllotaxis.fermat_spiral(n, scale) == expected
+
+    @pytest.mark.parametrize("n,inner_radius", [(0, 1.0), (500, 1.0), (2000, 0.5)])
+    def test_daisy_pattern(self, n, inner_radius):
+        """Test daisy florets, which start at index 1."""
+        expected = _points(
+            n, lambda i: inner_radius * math.sqrt(i), lambda i: i * GOLDEN_ANGLE, start=1
+        )
+        assert Phyllotaxis.daisy_pattern(n, inner_radius) == expected
+
+    def test_array_shape(self):
+        """Test the array forms hold one (x, y) row per point."""
+        assert Phyllotaxis.sunflower_pattern_array(10).shape == (10, 2)
+        assert Phyllotaxis.golden_spiral_array(0).shape == (0, 2)
+
+
+class TestNumbaKernel:
+    """Test the optional Numba sunflower kernel."""
+
+    @pytest.mark.parametrize("c", [2.0, 0.75])
+    def test_matches_numpy_path(self, c):
+        """Test the kernel agrees with the NumPy formula above NUMBA_MIN_POINTS."""
+        pytest.importorskip("numba")
+        from golden_ratio.phyllotaxis import HAVE_NUMBA, NUMBA_MIN_POINTS, TWO_PI
+
+        assert HAVE_NUMBA
+        n = NUMBA_MIN_POINTS * 3
+        i = np.arange(n, dtype=np.float64)
+        r = c * np.sqrt(i)
+        theta = np.mod(i * GOLDEN_ANGLE, TWO_PI)
+        expected = np.column_stack((r * np.cos(theta), r * np.sin(theta)))
+
+        # sin and cos may come from a different math library, so allow the last bit
+        points = Phyllotaxis.sunflower_pattern_array(n, c)
+        np.testing.assert_allclose(points, expected, rtol=1e-14, atol=1e-12)
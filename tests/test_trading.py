@@ -1,5 +1,6 @@
 """Tests for Fibonacci trading functions."""
 
+import numpy as np
 import pytest
 
 from golden_ratio.trading import FibonacciTrading
@@ -101,3 +102,31 @@ class TestFibonacciTrading:
         assert all_levels["retracements"] == retracements
         assert all_levels["extensions"] == extensions
         assert all_levels["golden_pocket"] == golden_pocket
+
+    def test_levels_are_immutable(self):
+        """Test the public levels cannot drift from the cached level arrays."""
+        assert isinstance(FibonacciTrading.RETRACEMENT_LEVELS, tuple)
+        assert isinstance(FibonacciTrading.EXTENSION_LEVELS, tuple)
+        levels = FibonacciTrading.retracements(200, 100)
+        assert len(levels) == len(FibonacciTrading.RETRACEMENT_LEVELS)
+
+    def test_retracements_tuple(self):
+        """Test that the named tuple matches the dict levels."""
+        for is_uptrend in (True, False):
+            levels = FibonacciTrading.retracements_tuple(200, 100, is_uptrend)
+            expected = FibonacciTrading.retracements(200, 100, is_uptrend)
+            assert list(levels) == list(expected.values())
+        assert abs(FibonacciTrading.retracements_tuple(200, 100).r618 - 138.2) < 0.01
+
+    def test_retracements_batch(self):
+        """Test that batched levels match the scalar method per row."""
+        highs = np.array([200.0, 50.0, 1.5])
+        lows = np.array([100.0, 40.0, 1.2])
+        trends = np.array([True, False, True])
+        batch = FibonacciTrading.retracements_batch(highs, lows, trends)
+        assert batch.shape == (3, 7)
+        for row, high, low, trend in zip(batch, highs, lows, trends):
+            expected = FibonacciTrading.retracements(high, low, bool(trend))
+            assert np.round(row, 4).tolist() == pytest.approx(list(expected.values()))
+        uptrend = FibonacciTrading.retracements_batch(highs, lows)
+        assert uptrend[:, 0].tolist() == highs.tolist()